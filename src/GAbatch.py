@@ -0,0 +1,122 @@
+import os
+import csv
+import copy
+import time
+import traceback
+import contextlib
+import multiprocessing
+import numpy
+from GAworker import run_GA
+
+# =======================
+# Multi-seed Batch Runner
+# =======================
+# Menjalankan GA untuk setiap seed di GAConfig.randomSeed4Optimization dan setiap
+# skenario (EnvConfig) dalam process pool. Skenario dimuat sekali di proses utama dan
+# dikirim sekali ke tiap worker lewat initializer; tiap task cukup membawa (nama, seed).
+# Kegagalan satu run dicatat di summary tanpa menghentikan run lain.
+_batchScenarios = {}
+
+def _initBatchWorker(scenarios, cnf, outputDir):
+    _batchScenarios['scenarios'] = scenarios
+    _batchScenarios['cnf'] = cnf
+    _batchScenarios['outputDir'] = outputDir
+
+def runFileStem(scenarioName, seed):
+    return f"{scenarioName}_seed{seed}"
+
+def _runSingle(task):
+    """Satu run GA (skenario, seed). Output run ditulis ke file log, bukan ke terminal."""
+    scenarioName, seed = task
+    outputDir = _batchScenarios['outputDir']
+    stem = runFileStem(scenarioName, seed)
+    cnf = copy.copy(_batchScenarios['cnf'])
+    cnf.randomSeed4Optimization = [seed]
+    if getattr(cnf, "checkpointPath", None):
+        cnf.checkpointPath = os.path.join(outputDir, f"{stem}.checkpoint.npz")
+    if getattr(cnf, "telemetryPath", None):
+        cnf.telemetryPath = os.path.join(outputDir, f"{stem}.telemetry")
+    allocationPath = os.path.join(outputDir, f"alloc_{stem}.json")
+    row = {"scenario": scenarioName, "seed": seed, "status": "ok", "fitness": None,
+           "seconds": 0.0, "allocation": allocationPath, "error": ""}
+    start = time.perf_counter()
+    try:
+        with open(os.path.join(outputDir, f"{stem}.log"), "w") as log, contextlib.redirect_stdout(log):
+            best = run_GA(_batchScenarios['scenarios'][scenarioName], cnf, outputPath=allocationPath)
+        row["fitness"] = [float(value) for value in best.getFitness()]
+    except Exception:
+        row["status"] = "failed"
+        row["allocation"] = ""
+        row["error"] = traceback.format_exc().strip().splitlines()[-1]
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+def writeSummary(rows, path):
+    """Tabel gabungan satu baris per run (CSV), urut skenario lalu seed."""
+    numberOfObjectives = max((len(row["fitness"]) for row in rows if row["fitness"]), default=0)
+    header = ["scenario", "seed", "status"] + [f"fitness{i}" for i in range(numberOfObjectives)] + ["seconds", "allocation", "error"]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for row in rows:
+            fitness = row["fitness"] or [""] * numberOfObjectives
+            writer.writerow([row["scenario"], row["seed"], row["status"]] + list(fitness) +
+                            [f"{row['seconds']:.3f}", row["allocation"], row["error"]])
+
+def runBatch(scenarios, cnf, seeds=None, numberOfProcesses=None, outputDir=None):
+    """
+    Jalankan GA untuk semua kombinasi skenario x seed.
+    scenarios: dict nama -> EnvConfig yang sudah dimuat.
+    seeds: default GAConfig.randomSeed4Optimization; numberOfProcesses: default
+    GAConfig.numberOfBatchProcesses; outputDir: default GAConfig.batchOutputDir.
+    Mengembalikan list baris summary (dict) yang juga ditulis ke <outputDir>/summary.csv.
+    """
+    seeds = list(seeds if seeds is not None else cnf.randomSeed4Optimization)
+    numberOfProcesses = numberOfProcesses or getattr(cnf, "numberOfBatchProcesses", 1)
+    outputDir = outputDir or getattr(cnf, "batchOutputDir", "data/batchGA")
+    if numberOfProcesses > 1 and (getattr(cnf, "numberOfIslands", 1) > 1 or getattr(cnf, "numberOfEvaluationWorkers", 1) > 1):
+        # Worker pool bersifat daemon dan tidak boleh membuat proses anak
+        raise ValueError("Batch paralel tidak bisa digabung dengan numberOfIslands/numberOfEvaluationWorkers > 1")
+    os.makedirs(outputDir, exist_ok=True)
+    tasks = [(name, seed) for name in scenarios for seed in seeds]
+    print(f"[GA-Batch] {len(tasks)} run ({len(scenarios)} skenario x {len(seeds)} seed) dengan {numberOfProcesses} proses...")
+
+    rows = []
+    if numberOfProcesses > 1:
+        with multiprocessing.Pool(numberOfProcesses, initializer=_initBatchWorker, initargs=(scenarios, cnf, outputDir)) as pool:
+            for row in pool.imap_unordered(_runSingle, tasks):
+                rows.append(row)
+                _reportProgress(row, len(rows), len(tasks))
+    else:
+        _initBatchWorker(scenarios, cnf, outputDir)
+        for task in tasks:
+            rows.append(_runSingle(task))
+            _reportProgress(rows[-1], len(rows), len(tasks))
+
+    order = {task: i for i, task in enumerate(tasks)}
+    rows.sort(key=lambda row: order[(row["scenario"], row["seed"])])
+    summaryPath = os.path.join(outputDir, "summary.csv")
+    writeSummary(rows, summaryPath)
+    _printScenarioStatistics(rows)
+    print(f"[GA-Batch] Summary disimpan ke {summaryPath}")
+    return rows
+
+def _reportProgress(row, done, total):
+    if row["status"] == "ok":
+        print(f"[GA-Batch] {done}/{total} {runFileStem(row['scenario'], row['seed'])} selesai "
+              f"({row['seconds']:.1f} detik). Fitness: {row['fitness']}")
+    else:
+        print(f"[GA-Batch] {done}/{total} {runFileStem(row['scenario'], row['seed'])} GAGAL: {row['error']}")
+
+def _printScenarioStatistics(rows):
+    """Ringkasan per skenario atas run yang berhasil: mean, std, min, max tiap objektif."""
+    for scenarioName in dict.fromkeys(row["scenario"] for row in rows):
+        scenarioRows = [row for row in rows if row["scenario"] == scenarioName]
+        fitness = numpy.array([row["fitness"] for row in scenarioRows if row["status"] == "ok"])
+        failed = len(scenarioRows) - len(fitness)
+        if len(fitness) == 0:
+            print(f"[GA-Batch] {scenarioName}: semua {failed} run gagal")
+            continue
+        print(f"[GA-Batch] {scenarioName}: {len(fitness)} run ok, {failed} gagal | "
+              f"mean {fitness.mean(axis=0).tolist()} std {fitness.std(axis=0).tolist()} "
+              f"min {fitness.min(axis=0).tolist()} max {fitness.max(axis=0).tolist()}")
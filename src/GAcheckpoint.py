@@ -0,0 +1,101 @@
+import os
+import numpy
+from solutionGA import SolutionGA
+from rngStreams import getGeneratorState, generatorFromState
+
+# =======================
+# GA Checkpoint / Resume
+# =======================
+# Snapshot berisi kromosom populasi dan arsip elit (bit-packed), array fitness,
+# isi fitness cache (kunci + fitness, urutan LRU; evaluations tidak menghitung cache hit,
+# jadi tanpa cache yang sama evaluationBudget berhenti di generasi lain setelah resume),
+# state RNG (Generator + SeedSequence, lihat rngStreams), baris telemetri yang sudah tercatat
+# (jika telemetri aktif) dan nomor generasi. Ditulis ke file
+# sementara lalu di-rename, sehingga checkpoint di disk tidak pernah setengah jadi.
+
+CHECKPOINT_VERSION = 2  # 2: state RNG numpy.random.Generator (versi 1: RandomState)
+
+def _packSolutions(solutions):
+    chromosomes = numpy.stack([sol.chromosome for sol in solutions])
+    fitness = numpy.array([sol.getFitness() for sol in solutions], dtype=numpy.float64)
+    return numpy.packbits(chromosomes, axis=-1), fitness
+
+def saveCheckpoint(path, ga_pop, generation, extra=None, telemetryRows=None):
+    """
+    Simpan state GAPopulation setelah `generation` generasi selesai.
+    extra: dict nilai numerik tambahan (mis. state kriteria berhenti), dikembalikan lewat ga_pop.checkpointExtra.
+    telemetryRows: RunTelemetry.rows(), dikembalikan lewat ga_pop.checkpointTelemetry.
+    """
+    populationPacked, populationFitness = _packSolutions(ga_pop.population)
+    arrays = {
+        "version": numpy.array(CHECKPOINT_VERSION),
+        "generation": numpy.array(generation),
+        "shape": numpy.array(ga_pop.population[0].chromosome.shape),
+        "populationPacked": populationPacked,
+        "populationFitness": populationFitness,
+        "evaluations": numpy.array(ga_pop.evaluations),
+    }
+    for name, value in (extra or {}).items():
+        arrays[f"extra_{name}"] = numpy.asarray(value)
+    if ga_pop.eliteArchive:
+        arrays["elitePacked"], arrays["eliteFitness"] = _packSolutions(ga_pop.eliteArchive)
+    if ga_pop.cache is not None and ga_pop.cache.entries:
+        arrays["cacheKeys"] = numpy.frombuffer(b"".join(ga_pop.cache.entries.keys()), dtype=numpy.uint8).reshape(len(ga_pop.cache.entries), -1)
+        arrays["cacheFitness"] = numpy.array(list(ga_pop.cache.entries.values()), dtype=numpy.float64)
+        arrays["cacheStats"] = numpy.array([ga_pop.cache.hits, ga_pop.cache.misses])
+    if telemetryRows is not None:
+        arrays["telemetryRows"] = telemetryRows
+    arrays["rngState"] = numpy.array(getGeneratorState(ga_pop.rng, ga_pop.seedSequence))
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmpPath = f"{path}.{os.getpid()}.tmp"
+    with open(tmpPath, "wb") as f:
+        numpy.savez_compressed(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmpPath, path)
+    print(f"[GA] Checkpoint generasi {generation} disimpan ke {path}")
+
+def _unpackSolutions(packed, fitness, numberOfNodes, rng, ec, cnf):
+    solutions = []
+    for chromosome, values in zip(numpy.unpackbits(packed, axis=-1, count=numberOfNodes), fitness):
+        sol = SolutionGA.fromChromosome(rng, ec, cnf, chromosome)
+        sol.setFitness(values.tolist())
+        solutions.append(sol)
+    return solutions
+
+def loadCheckpoint(path, ec, cnf, populationClass):
+    """
+    Bangun kembali populasi dari checkpoint. Mengembalikan (ga_pop, generasi yang sudah selesai).
+    Evolusi yang dilanjutkan dari sini identik bit-per-bit dengan run tanpa interupsi.
+    """
+    with numpy.load(path) as data:
+        if int(data["version"]) != CHECKPOINT_VERSION:
+            raise ValueError(f"Versi checkpoint {int(data['version'])} tidak didukung")
+        numberOfServices, numberOfNodes = data["shape"].tolist()
+        if (numberOfServices, numberOfNodes) != (ec.getNumberOfServices(), ec.getNumberOfNodes()):
+            raise ValueError(f"Checkpoint untuk skenario {numberOfServices} service x {numberOfNodes} node, bukan skenario ini")
+        rng, seedSequence = generatorFromState(str(data["rngState"]))
+        population = _unpackSolutions(data["populationPacked"], data["populationFitness"], numberOfNodes, rng, ec, cnf)
+        elites = []
+        if "elitePacked" in data:
+            elites = _unpackSolutions(data["elitePacked"], data["eliteFitness"], numberOfNodes, rng, ec, cnf)
+        generation = int(data["generation"])
+        evaluations = int(data["evaluations"])
+        extra = {name[len("extra_"):]: data[name].tolist() for name in data.files if name.startswith("extra_")}
+        telemetryRows = data["telemetryRows"] if "telemetryRows" in data else None
+        cache = None
+        if "cacheKeys" in data:
+            cache = (data["cacheKeys"], data["cacheFitness"], data["cacheStats"].tolist())
+    ga_pop = populationClass(len(population), rng, ec, cnf, initialSolutions=population, seedSequence=seedSequence)
+    ga_pop.eliteArchive = elites
+    ga_pop.evaluations = evaluations
+    if cache is not None and ga_pop.cache is not None:
+        keys, fitness, (hits, misses) = cache
+        for key, values in zip(keys, fitness):
+            ga_pop.cache.put(key.tobytes(), values.tolist())
+        ga_pop.cache.hits, ga_pop.cache.misses = hits, misses
+    ga_pop.checkpointExtra = extra
+    ga_pop.checkpointTelemetry = telemetryRows
+    print(f"[GA] Melanjutkan dari checkpoint {path} (generasi {generation} selesai)")
+    return ga_pop, generation
@@ -0,0 +1,144 @@
+import math
+import traceback
+import multiprocessing
+import numpy
+from solutionGA import SolutionGA
+from GAworker import GAPopulation
+from rngStreams import makeGenerator
+from warmStart import warmStartSolutions
+
+# =======================
+# Island Model GA
+# =======================
+# Tiap pulau adalah satu GAPopulation di proses terpisah dengan stream RNG sendiri.
+# Setiap migrationInterval generasi, tiap pulau mengirim top-k individunya ke
+# koordinator, yang meneruskannya ke pulau tujuan sesuai topologi migrasi.
+# Emigran dibandingkan dengan getRankKey() (mode feasibilityRules: pelanggaran lebih dulu).
+# Opsi yang butuh kontrol per generasi di satu populasi (kriteria berhenti, telemetri,
+# checkpoint/resume) belum didukung dan ditolak oleh run_GA.
+
+MIGRATION_TOPOLOGIES = ("ring", "full")
+
+def _packChromosomes(solutions):
+    return numpy.packbits(numpy.stack([sol.chromosome for sol in solutions]), axis=-1)
+
+def _islandProcess(islandId, seedSequence, ec, cnf, populationClass, reference, conn):
+    """Loop utama satu pulau: terima imigran, evolusi beberapa generasi, kirim emigran."""
+    try:
+        rng = makeGenerator(seedSequence)
+        popSize = cnf.numberOfSolutionsInWorkers
+        # Warm start: tiap pulau di-seed dari alokasi referensi dengan stream RNG-nya sendiri
+        initialSolutions = warmStartSolutions(rng, ec, cnf, reference, popSize) if reference is not None else None
+        ga_pop = populationClass(popSize, rng, ec, cnf, initialSolutions=initialSolutions, seedSequence=seedSequence)
+        numberOfNodes = ec.getNumberOfNodes()
+        migrationSize = getattr(cnf, "migrationSize", 2)
+        try:
+            while True:
+                command = conn.recv()
+                if command[0] == 'stop':
+                    break
+                _, generations, immigrants, immigrantsFitness = command
+                if immigrants is not None:
+                    chromosomes = numpy.unpackbits(immigrants, axis=-1, count=numberOfNodes)
+                    newcomers = []
+                    for chromosome, fitness in zip(chromosomes, immigrantsFitness):
+                        sol = ga_pop.population[0].offspring(chromosome)
+                        sol.setFitness(list(fitness))
+                        newcomers.append(sol)
+                    ga_pop.immigrate(newcomers)
+                for gen in range(generations):
+                    ga_pop.evolve()
+                emigrants = ga_pop.getTop(migrationSize)
+                conn.send(('migrants', _packChromosomes(emigrants), [sol.getFitness() for sol in emigrants],
+                           [sol.getRankKey() for sol in emigrants]))
+        finally:
+            ga_pop.close()
+    except Exception:
+        conn.send(('error', f"Pulau {islandId}:\n{traceback.format_exc()}"))
+    finally:
+        conn.close()
+
+def _migrationSources(islandId, numberOfIslands, topology):
+    if topology == "ring":
+        return [(islandId - 1) % numberOfIslands]
+    return [i for i in range(numberOfIslands) if i != islandId]
+
+def runIslandModel(ec, cnf, randomseed, populationClass=GAPopulation, reference=None):
+    """
+    Jalankan GA model pulau sesuai GAConfig dan kembalikan solusi terbaik global.
+    Parameter GAConfig: numberOfIslands, migrationInterval, migrationSize, migrationTopology.
+    populationClass: GAPopulation atau NSGA2Population; reference: kromosom warm start (atau None).
+    """
+    numberOfIslands = cnf.numberOfIslands
+    generations = cnf.numberOfGenerations
+    interval = max(1, getattr(cnf, "migrationInterval", 5))
+    migrationSize = getattr(cnf, "migrationSize", 2)
+    topology = getattr(cnf, "migrationTopology", "ring")
+    if topology not in MIGRATION_TOPOLOGIES:
+        raise ValueError(f"migrationTopology harus salah satu dari {MIGRATION_TOPOLOGIES}, bukan {topology!r}")
+
+    print(f"[GA-Island] Menjalankan {numberOfIslands} pulau, migrasi {topology} setiap {interval} generasi (top-{migrationSize})...")
+    seedSequences = numpy.random.SeedSequence(randomseed).spawn(numberOfIslands)
+    connections = []
+    processes = []
+    for islandId in range(numberOfIslands):
+        parentConn, childConn = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_islandProcess, args=(islandId, seedSequences[islandId], ec, cnf,
+                                                                         populationClass, reference, childConn))
+        process.start()
+        childConn.close()
+        connections.append(parentConn)
+        processes.append(process)
+
+    migrants = [None] * numberOfIslands
+    try:
+        epochs = math.ceil(generations / interval)
+        for epoch in range(epochs):
+            epochGenerations = min(interval, generations - epoch * interval)
+            for islandId, conn in enumerate(connections):
+                if epoch == 0:
+                    conn.send(('evolve', epochGenerations, None, None))
+                    continue
+                # Kumpulkan emigran dari pulau sumber lalu ambil top-k
+                candidates = []
+                for source in _migrationSources(islandId, numberOfIslands, topology):
+                    _, _, rankKeys = migrants[source]
+                    candidates.extend((rankKey, idx, source) for idx, rankKey in enumerate(rankKeys))
+                candidates.sort(key=lambda c: c[0])
+                selected = candidates[:migrationSize]
+                immigrants = numpy.stack([migrants[source][0][idx] for (_, idx, source) in selected])
+                conn.send(('evolve', epochGenerations, immigrants, [migrants[source][1][idx] for (_, idx, source) in selected]))
+            for islandId, conn in enumerate(connections):
+                reply = conn.recv()
+                if reply[0] == 'error':
+                    raise RuntimeError(f"[GA-Island] Pulau gagal: {reply[1]}")
+                migrants[islandId] = (reply[1], reply[2], reply[3])
+            bestFitness = min((rankKey, fitness) for (_, fitnessList, rankKeys) in migrants
+                              for fitness, rankKey in zip(fitnessList, rankKeys))[1]
+            done = min(generations, (epoch + 1) * interval)
+            print(f"[GA-Island] Generasi {done}/{generations} selesai. Fitness terbaik global: {bestFitness}")
+    finally:
+        for conn in connections:
+            try:
+                conn.send(('stop',))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in processes:
+            process.join()
+
+    # Emigran terakhir tiap pulau sudah memuat individu terbaik pulau tersebut
+    rng = makeGenerator(randomseed)
+    finalists = []
+    for packed, fitnessList, _ in migrants:
+        for chromosome, fitness in zip(numpy.unpackbits(packed, axis=-1, count=ec.getNumberOfNodes()), fitnessList):
+            sol = SolutionGA.fromChromosome(rng, ec, cnf, chromosome)
+            sol.setFitness(list(fitness))
+            finalists.append(sol)
+    if getattr(cnf, "optimizationMode", "single") == "nsga2":
+        # Anggota front Pareto gabungan emigran terakhir, dipilih sesuai paretoPreference
+        from nsga2 import fastNonDominatedSort, chooseFrontMember
+        F = numpy.array([sol.getFitness() for sol in finalists], dtype=numpy.float64)
+        violations = numpy.array([sol.getTotalViolation() for sol in finalists]) if finalists[0].constraintHandling == "feasibilityRules" else None
+        _, fronts = fastNonDominatedSort(F, violations)
+        return chooseFrontMember([finalists[i] for i in fronts[0]], getattr(cnf, "paretoPreference", "knee"))
+    return min(finalists, key=lambda sol: sol.getRankKey())
@@ -2,24 +2,357 @@ import sys
 import numpy
 import json
 import random
+import time
+import hashlib
+import heapq
+import multiprocessing
+from collections import OrderedDict
 from solutionGA import SolutionGA
+from objectiveRegistry import getObjective, weightedSumObjective
+from crossoverOperators import batchCrossover
+from constraintHandling import batchConstraintViolations
+from localSearch import LocalSearch
+from rngStreams import rootSeedSequence, makeGenerator, spawnGenerators
+from GAcheckpoint import saveCheckpoint, loadCheckpoint
+from gaTelemetry import RunTelemetry
+from gaTrace import getLogger, count, takeSummary, formatSummary, timedPhase, phase, takePhaseTimes
+
+logger = getLogger(__name__)
+
+# =======================
+# Parallel Fitness Evaluation
+# =======================
+# Data skenario disimpan sebagai global di tiap proses worker. Diisi sekali oleh
+# initializer pool, sehingga tiap task cukup membawa kromosom (bit-packed).
+_workerScenario = {}
+
+def _initEvaluationWorker(infrastructure, objectiveNames, numberOfNodes, weightedTerms):
+    # Objektif gabungan didaftarkan ulang di worker (tidak bergantung pada start method fork)
+    for terms in weightedTerms:
+        weightedSumObjective(terms)
+    _workerScenario['infrastructure'] = infrastructure
+    _workerScenario['objectiveNames'] = objectiveNames
+    _workerScenario['numberOfNodes'] = numberOfNodes
+
+def _evaluatePackedChromosomes(packedChromosomes):
+    chromosomes = numpy.unpackbits(packedChromosomes, axis=-1, count=_workerScenario['numberOfNodes'])
+    infrastructure = _workerScenario['infrastructure']
+    return numpy.column_stack([
+        getObjective(name).batch(chromosomes, infrastructure) for name in _workerScenario['objectiveNames']
+    ])
+
+class ParallelEvaluator:
+    """
+    Pool proses untuk evaluasi objektif batch.
+    Resource, jarak dan client node dikirim sekali saat pool dibuat; per generasi hanya
+    kromosom bit-packed yang dikirim ke worker. Worker memakai fungsi batch yang sama
+    dengan mode serial sehingga nilai fitness identik.
+    """
+    def __init__(self, numberOfWorkers, infrastructure, objectives, numberOfNodes):
+        """objectives: Objective yang punya varian batch (objektif gabungan dikirim sebagai (nama, bobot))."""
+        self.numberOfWorkers = numberOfWorkers
+        self.objectiveNames = [objective.name for objective in objectives]
+        weightedTerms = [[(component.name, weight) for component, weight in objective.components]
+                         for objective in objectives if objective.components is not None]
+        self.pool = multiprocessing.Pool(
+            numberOfWorkers,
+            initializer=_initEvaluationWorker,
+            initargs=(infrastructure, self.objectiveNames, numberOfNodes, weightedTerms)
+        )
+
+    def evaluate(self, chromosomes):
+        """Kembalikan array (populasi x objektif) untuk objectiveNames."""
+        packed = numpy.packbits(chromosomes, axis=-1)
+        chunks = [chunk for chunk in numpy.array_split(packed, self.numberOfWorkers) if len(chunk) > 0]
+        return numpy.concatenate(self.pool.map(_evaluatePackedChromosomes, chunks))
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+# =======================
+# Fitness Cache
+# =======================
+class FitnessCache:
+    """
+    Cache LRU berukuran tetap untuk nilai fitness.
+    Kunci berupa hash blake2b dari kromosom yang sudah di-packbits, sehingga
+    kromosom identik hasil crossover/mutasi tidak perlu dievaluasi ulang.
+    """
+    def __init__(self, maxSize):
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(chromosome):
+        return hashlib.blake2b(numpy.packbits(chromosome).tobytes(), digest_size=16).digest()
+
+    def get(self, key):
+        fitness = self.entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key, fitness):
+        self.entries[key] = tuple(fitness)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.entries),
+        }
+
+# =======================
+# Best/Worst Index
+# =======================
+class PopulationIndex:
+    """
+    Heap min dan heap max atas fitness populasi, untuk lookup best/worst O(log n).
+    Slot yang diganti hanya menaikkan versinya; entri heap lama dibuang saat muncul di puncak.
+    """
+    def __init__(self, population):
+        self.population = population
+        self.version = [0] * len(population)
+        self.rebuild()
+
+    def rebuild(self):
+        self.minHeap = [(tuple(sol.getRankKey()), slot, self.version[slot]) for slot, sol in enumerate(self.population)]
+        self.maxHeap = [(tuple(-v for v in sol.getRankKey()), slot, self.version[slot]) for slot, sol in enumerate(self.population)]
+        heapq.heapify(self.minHeap)
+        heapq.heapify(self.maxHeap)
+
+    def replace(self, slot, sol):
+        self.population[slot] = sol
+        self.version[slot] += 1
+        heapq.heappush(self.minHeap, (tuple(sol.getRankKey()), slot, self.version[slot]))
+        heapq.heappush(self.maxHeap, (tuple(-v for v in sol.getRankKey()), slot, self.version[slot]))
+        # Cegah heap membengkak oleh entri usang
+        if len(self.minHeap) > 4 * len(self.population):
+            self.rebuild()
+
+    def _top(self, heap):
+        while heap[0][2] != self.version[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def bestSlot(self):
+        return self._top(self.minHeap)
+
+    def worstSlot(self):
+        return self._top(self.maxHeap)
+
+# =======================
+# Stopping Criteria
+# =======================
+class StoppingCriteria:
+    """
+    Kriteria berhenti lebih awal dari GAConfig (semua opsional, None = nonaktif):
+    stagnationGenerations, diversityFloor, timeBudgetSeconds, evaluationBudget.
+    check() dipanggil setiap akhir generasi dan mengembalikan alasan berhenti atau None.
+    """
+    def __init__(self, cnf):
+        self.stagnationGenerations = getattr(cnf, "stagnationGenerations", None)
+        self.diversityFloor = getattr(cnf, "diversityFloor", None)
+        self.timeBudgetSeconds = getattr(cnf, "timeBudgetSeconds", None)
+        self.evaluationBudget = getattr(cnf, "evaluationBudget", None)
+        self.startTime = time.perf_counter()
+        self.bestFitness = None
+        self.stagnantGenerations = 0
+
+    def check(self, ga_pop):
+        best = list(ga_pop.getBest().getRankKey())
+        if self.bestFitness is None or best < self.bestFitness:
+            self.bestFitness = best
+            self.stagnantGenerations = 0
+        else:
+            self.stagnantGenerations += 1
+        if self.stagnationGenerations is not None and self.stagnantGenerations >= self.stagnationGenerations:
+            return f"stagnasi: fitness terbaik tidak membaik selama {self.stagnantGenerations} generasi"
+        if self.diversityFloor is not None:
+            diversity = ga_pop.diversity()
+            if diversity < self.diversityFloor:
+                return f"diversitas populasi {diversity:.4f} di bawah batas {self.diversityFloor}"
+        if self.timeBudgetSeconds is not None:
+            elapsed = time.perf_counter() - self.startTime
+            if elapsed >= self.timeBudgetSeconds:
+                return f"batas waktu {self.timeBudgetSeconds} detik tercapai ({elapsed:.1f} detik)"
+        if self.evaluationBudget is not None and ga_pop.evaluations >= self.evaluationBudget:
+            return f"batas evaluasi fitness {self.evaluationBudget} tercapai ({ga_pop.evaluations} evaluasi)"
+        return None
+
+    def getState(self):
+        """State yang ikut disimpan di checkpoint agar resume tetap identik."""
+        state = {"stagnantGenerations": self.stagnantGenerations}
+        if self.bestFitness is not None:
+            state["stagnationBest"] = self.bestFitness
+        return state
+
+    def setState(self, state):
+        self.stagnantGenerations = int(state.get("stagnantGenerations", 0))
+        if "stagnationBest" in state:
+            self.bestFitness = list(state["stagnationBest"])
 
 # =======================
 # GA Population Management
 # =======================
 class GAPopulation:
-    def __init__(self, pop_size, rng, ec, cnf):
+    def __init__(self, pop_size, rng, ec, cnf, initialSolutions=None, seedSequence=None):
+        """
+        initialSolutions: individu yang sudah ada (checkpoint/warm start); fitness yang sudah terisi tidak dihitung ulang.
+        seedSequence: SeedSequence asal rng (lihat rngStreams); None: diturunkan dari stream rng.
+        """
         print(f"[GA] Inisialisasi populasi awal ({pop_size} individu)...")
-        self.population = []
+        self.population = list(initialSolutions) if initialSolutions is not None else []
         self.rng = rng
+        self.seedSequence = seedSequence if seedSequence is not None else numpy.random.SeedSequence(rng.integers(2**32, size=4))
         self.ec = ec
         self.cnf = cnf
-        for i in range(pop_size):
-            sol = SolutionGA(rng, ec, cnf)
-            sol.calculateFitness()
+        self.evaluator = None
+        self.localSearch = None
+        self.evaluations = 0  # jumlah evaluasi fitness yang benar-benar dihitung (bukan cache hit)
+        cacheSize = getattr(cnf, "fitnessCacheSize", 0)
+        self.cache = FitnessCache(cacheSize) if cacheSize > 0 else None
+        # Tiap individu baru dibangun dengan stream RNG sendiri (spawn dari SeedSequence populasi),
+        # lalu memakai stream populasi untuk operator evolusi
+        creationRngs = spawnGenerators(self.seedSequence, max(0, pop_size - len(self.population)))
+        for i, creationRng in zip(range(len(self.population), pop_size), creationRngs):
+            sol = SolutionGA(creationRng, ec, cnf)
+            sol.randomNG = rng
             self.population.append(sol)
             if (i+1) % 10 == 0 or (i+1) == pop_size:
                 print(f"[GA] Populasi: {i+1}/{pop_size} individu selesai.")
+        numberOfWorkers = getattr(cnf, "numberOfEvaluationWorkers", 1)
+        template = self.population[0]
+        if numberOfWorkers > 1 and template.constraintHandling == "repair" and \
+                all(objective.incremental is not None for objective in template.objectives):
+            # Mode repair: semua individu baru punya DeltaState (init, repair, checkConstraints),
+            # sehingga computeFitness selalu memakai jalur incremental dan pool tidak akan terpakai
+            print(f"[GA] Catatan: numberOfEvaluationWorkers={numberOfWorkers} diabaikan; semua objektif dievaluasi incremental pada mode repair.")
+        elif numberOfWorkers > 1:
+            print(f"[GA] Evaluasi fitness paralel dengan {numberOfWorkers} worker.")
+            batchObjectives = [objective for objective in template.objectives if objective.batch is not None]
+            self.evaluator = ParallelEvaluator(numberOfWorkers, template.infrastructure, batchObjectives, template.numberOfNodes)
+        self.evaluatePopulation([sol for sol in self.population if getattr(sol, "fitness", None) is None])
+        # Arsip elit: individu terbaik yang pernah ditemukan, dibawa ke generasi berikutnya
+        self.eliteSize = getattr(cnf, "eliteSize", 0)
+        self.eliteArchive = []
+        self.updateEliteArchive()
+        self.index = PopulationIndex(self.population)
+
+    def close(self):
+        """Hentikan pool worker evaluasi (jika ada)."""
+        if self.evaluator is not None:
+            self.evaluator.close()
+            self.evaluator = None
+
+    @timedPhase("evaluation")
+    def evaluatePopulation(self, solutions):
+        """
+        Hitung fitness banyak individu sekaligus.
+        Kromosom ditumpuk menjadi tensor (populasi x service x node) sehingga tiap objektif
+        cukup dihitung dengan beberapa operasi NumPy. Objektif tanpa versi batch
+        dievaluasi per individu seperti pada SolutionGA.calculateFitness.
+        Jika fitness cache aktif, hanya kromosom yang belum pernah dievaluasi yang dihitung.
+        Individu yang bisa dievaluasi incremental (DeltaState masih berlaku) melewati cache:
+        hash kromosom O(service x node) lebih mahal dari evaluasi incremental itu sendiri.
+        """
+        if not solutions:
+            return
+        if self.cache is None:
+            self.computeFitness(solutions)
+            self.handleConstraints(solutions)
+            return
+        pending = []
+        pendingKeys = {}
+        duplicates = []
+        incremental = all(objective.incremental is not None for objective in solutions[0].objectives)
+        for sol in solutions:
+            if incremental and sol.getDeltaState(create=False) is not None:
+                pending.append(sol)
+                continue
+            key = FitnessCache.key(sol.chromosome)
+            cached = self.cache.get(key)
+            if cached is not None:
+                sol.setFitness(list(cached))
+            elif key in pendingKeys:
+                # Kromosom yang sama muncul dua kali dalam satu batch
+                duplicates.append((sol, pendingKeys[key]))
+            else:
+                pendingKeys[key] = sol
+                pending.append(sol)
+        self.computeFitness(pending)
+        for key, sol in pendingKeys.items():
+            self.cache.put(key, sol.getFitness())
+        for sol, original in duplicates:
+            sol.setFitness(list(original.getFitness()))
+        self.handleConstraints(solutions)
+
+    def handleConstraints(self, solutions):
+        """
+        Mode penalty/feasibilityRules: hitung vektor pelanggaran semua individu dalam satu
+        operasi batch. Pada mode penalty, fitness (mentah, seperti yang disimpan di cache)
+        ditambah penaltyWeight * total pelanggaran.
+        """
+        mode = solutions[0].constraintHandling
+        if mode == "repair":
+            return
+        pending = [sol for sol in solutions if sol.violations is None]
+        if pending:
+            template = pending[0]
+            violations = batchConstraintViolations(numpy.stack([sol.chromosome for sol in pending]), template.infrastructure,
+                                                   template.forcedServices, template.forcedNodes)
+            for sol, violation in zip(pending, violations):
+                sol.violations = violation
+        if mode == "penalty":
+            weight = getattr(self.cnf, "penaltyWeight", 10.0)
+            for sol in solutions:
+                total = sol.getTotalViolation()
+                if total > 0:
+                    count("anak_infeasible")
+                    sol.setFitness([value + weight * total for value in sol.getFitness()])
+        else:
+            count("anak_infeasible", sum(1 for sol in solutions if sol.getTotalViolation() > 0))
+
+    def computeFitness(self, solutions):
+        if not solutions:
+            return
+        self.evaluations += len(solutions)
+        # Individu yang DeltaState-nya masih berlaku (hasil repair/mutasi) dievaluasi
+        # inkremental; sisanya lewat jalur batch
+        if all(objective.incremental is not None for objective in solutions[0].objectives):
+            remaining = []
+            for sol in solutions:
+                if sol.getDeltaState(create=False) is not None:
+                    sol.setFitness([objective.incremental(sol) for objective in sol.objectives])
+                else:
+                    remaining.append(sol)
+            solutions = remaining
+            if not solutions:
+                return
+        chromosomes = numpy.stack([sol.chromosome for sol in solutions])
+        infrastructure = solutions[0].infrastructure
+        parallelValues = self.evaluator.evaluate(chromosomes) if self.evaluator is not None else None
+        columns = []
+        for objective in solutions[0].objectives:
+            if objective.batch is None:
+                columns.append([objective.evaluate(sol) for sol in solutions])
+            elif parallelValues is not None:
+                columns.append(parallelValues[:, self.evaluator.objectiveNames.index(objective.name)].tolist())
+            else:
+                columns.append(objective.batch(chromosomes, infrastructure).tolist())
+        for i, sol in enumerate(solutions):
+            sol.setFitness([column[i] for column in columns])
 
     def getFitnessList(self):
         return [
@@ -27,35 +360,179 @@ class GAPopulation:
             for sol in self.population
         ]
 
+    @timedPhase("selection")
     def tournament_selection(self):
         a, b = self.rng.choice(len(self.population), 2, replace=False)
-        return self.population[a] if self.population[a].getFitness() < self.population[b].getFitness() else self.population[b]
+        return self.population[a] if self.population[a].getRankKey() < self.population[b].getRankKey() else self.population[b]
 
-    def evolve(self):
-        print("[GA] Evolusi generasi baru...")
-        new_population = []
-        best_fitness = self.getBest().getFitness()
-        for _ in range(len(self.population)):
+    def breedOffspring(self, count):
+        """Hasilkan tepat `count` anak lewat seleksi, crossover dan mutasi (belum dievaluasi)."""
+        if getattr(self.cnf, "batchCrossover", False):
+            return self.breedOffspringBatch(count)
+        offspring = []
+        while len(offspring) < count:
             parent1 = self.tournament_selection()
             parent2 = self.tournament_selection()
-            children = parent1.crossover(parent2.getChromosome())
-            for child in children:
+            for child in parent1.crossover(parent2.chromosome):
                 if self.rng.random() < self.cnf.mutationProbability:
                     child.mutate()
-                child.calculateFitness()
-                new_population.append(child)
-                # Print jika ada solusi lebih baik
-                if child.getFitness() < best_fitness:
-                    print(f"[GA] Solusi terbaik baru ditemukan: {child.getFitness()}")
-                if len(new_population) >= len(self.population):
+                offspring.append(child)
+                if len(offspring) >= count:
                     break
-        self.population = new_population
+        return offspring
+
+    def breedOffspringBatch(self, numberOfChildren):
+        """
+        Seperti breedOffspring, tetapi crossover seluruh mating pool dilakukan dalam satu
+        panggilan batchCrossover. Pasangan yang anaknya tetap infeasible setelah repair
+        diulang lewat SolutionGA.crossover.
+        """
+        numberOfPairs = (numberOfChildren + 1) // 2
+        parents = [(self.tournament_selection(), self.tournament_selection()) for _ in range(numberOfPairs)]
+        with phase("crossover"):
+            children1, children2 = batchCrossover(self.rng,
+                                                  numpy.stack([p1.chromosome for p1, _ in parents]),
+                                                  numpy.stack([p2.chromosome for _, p2 in parents]),
+                                                  getattr(self.cnf, "crossoverOperator", "twoPoint"))
+        offspring = []
+        for i, (parent1, parent2) in enumerate(parents):
+            count("crossover")
+            if parent1.constraintHandling != "repair":
+                children = [parent1.offspring(children1[i]), parent1.offspring(children2[i])]
+            else:
+                children = [parent1.repairedOffspring(children1[i]), parent1.repairedOffspring(children2[i])]
+            if parent1.constraintHandling == "repair" and not all(child.checkConstraints() for child in children):
+                count("crossover_ulang")
+                children = parent1.crossover(parent2.chromosome)
+            for child in children:
+                if self.rng.random() < self.cnf.mutationProbability:
+                    child.mutate()
+                offspring.append(child)
+        return offspring[:numberOfChildren]
+
+    def evolve(self):
+        if getattr(self.cnf, "evolutionMode", "generational") == "steadyState":
+            self.evolveSteadyState()
+            return
+        print("[GA] Evolusi generasi baru...")
+        best_fitness = self.getBest().getRankKey()
+        elites = self.eliteArchive[:self.eliteSize]
+        new_population = self.breedOffspring(len(self.population) - len(elites))
+        self.evaluatePopulation(new_population)
+        for child in new_population:
+            if child.getRankKey() < best_fitness:
+                count("anak_lebih_baik")
+                logger.debug("Solusi terbaik baru ditemukan: %s", child.getFitness())
+        self.population = new_population + elites
+        self.updateEliteArchive()
+        self.index = PopulationIndex(self.population)
+        self.applyLocalSearch()
         print("[GA] Evolusi generasi selesai.")
 
+    def evolveSteadyState(self):
+        """
+        Satu "generasi" steady-state: sebanyak ukuran populasi anak dibuat berpasangan,
+        dan tiap anak langsung menggantikan individu terburuk jika lebih baik.
+        Individu terbaik tidak pernah hilang, sehingga evaluasi hanya dipakai untuk anak baru.
+        """
+        print("[GA] Evolusi steady-state...")
+        popSize = len(self.population)
+        produced = 0
+        while produced < popSize:
+            children = self.breedOffspring(min(2, popSize - produced))
+            self.evaluatePopulation(children)
+            for child in children:
+                worstSlot = self.index.worstSlot()
+                if child.getRankKey() < self.population[worstSlot].getRankKey():
+                    if child.getRankKey() < self.getBest().getRankKey():
+                        count("anak_lebih_baik")
+                        logger.debug("Solusi terbaik baru ditemukan: %s", child.getFitness())
+                    self.index.replace(worstSlot, child)
+            produced += len(children)
+        self.updateEliteArchive()
+        self.applyLocalSearch()
+        print("[GA] Evolusi steady-state selesai.")
+
+    def localSearchSlots(self, k):
+        """Slot populasi yang diperbaiki local search: k individu terbaik."""
+        return sorted(range(len(self.population)), key=lambda i: self.population[i].getRankKey())[:k]
+
+    @timedPhase("localSearch")
+    def applyLocalSearch(self):
+        """
+        Tahap memetic: localSearchTopK individu terbaik diperbaiki dengan local search
+        first-improvement (lihat localSearch.py). Individu yang membaik menggantikan slotnya.
+        Mengembalikan jumlah individu yang membaik.
+        """
+        k = getattr(self.cnf, "localSearchTopK", 0)
+        if k <= 0:
+            return 0
+        if self.localSearch is None:
+            self.localSearch = LocalSearch(self.population[0], self.cnf, self.rng)
+        improvedCount = 0
+        for slot in self.localSearchSlots(k):
+            sol = self.population[slot]
+            # Local search hanya menjaga feasibility, tidak memperbaiki individu infeasible
+            if sol.constraintHandling != "repair" and sol.getTotalViolation() > 0:
+                continue
+            improved = self.localSearch.improve(sol)
+            if improved is not None:
+                self.evaluations += 1
+                self.index.replace(slot, improved)
+                improvedCount += 1
+        count("ls_individu_membaik", improvedCount)
+        if improvedCount:
+            self.updateEliteArchive()
+        return improvedCount
+
+    def updateEliteArchive(self):
+        """Simpan eliteSize individu terbaik (kromosom unik) dari arsip lama + populasi saat ini."""
+        if self.eliteSize <= 0:
+            return
+        archive = []
+        seen = set()
+        for sol in sorted(self.eliteArchive + self.population, key=lambda s: s.getRankKey()):
+            key = FitnessCache.key(sol.chromosome)
+            if key not in seen:
+                seen.add(key)
+                archive.append(sol)
+                if len(archive) >= self.eliteSize:
+                    break
+        self.eliteArchive = archive
+
     def getBest(self):
-        return min(self.population, key=lambda s: s.getFitness())
+        return self.population[self.index.bestSlot()]
 
-def save_allocation_to_json(best_solution, app_json_path, net_json_path, output_path):
+    def diversity(self):
+        """
+        Rata-rata jarak Hamming antar pasangan individu, dinormalisasi ke [0, 1].
+        Dihitung dari frekuensi bit per gen: pasangan berbeda di satu gen = c * (P - c).
+        Dinormalisasi dengan jumlah gen yang bernilai 1 di minimal satu individu, bukan semua
+        sel service x node: kromosom penempatan sangat jarang, sehingga pembagi semua sel membuat
+        nilainya sangat kecil dan bergantung pada ukuran topologi.
+        """
+        popSize = len(self.population)
+        if popSize < 2:
+            return 0.0
+        counts = numpy.sum([sol.chromosome for sol in self.population], axis=0, dtype=numpy.int64)
+        activeGenes = int((counts > 0).sum())
+        if activeGenes == 0:
+            return 0.0
+        differingPairs = (counts * (popSize - counts)).sum()
+        return float(differingPairs) / (popSize * (popSize - 1) / 2.0 * activeGenes)
+
+    def getTop(self, k):
+        """k individu terbaik menurut urutan seleksi populasi (GAPopulation: getRankKey, NSGA-II: rank lalu crowding)."""
+        return [self.population[i] for i in self.localSearchSlots(k)]
+
+    def immigrate(self, solutions):
+        """Ganti individu terburuk dengan individu pendatang yang fitness-nya sudah dihitung."""
+        order = sorted(range(len(self.population)), key=lambda i: self.population[i].getRankKey(), reverse=True)
+        for idx, sol in zip(order, solutions):
+            self.index.replace(idx, sol)
+        self.updateEliteArchive()
+
+def save_allocation_to_json(best_solution, app_json_path, net_json_path, output_path, users_json_path="data/usersDefinition.json"):
     # Load app definition
     with open(app_json_path, "r") as f:
         app_json = json.load(f)
@@ -86,7 +563,7 @@ def save_allocation_to_json(best_solution, app_json_path, net_json_path, output_
         json.dump({"initialAllocation": allocation}, f, indent=4)
       # PATCH: Pastikan module tujuan user dialokasikan di node yang sama dengan user source
     try:
-        with open("data/usersDefinition.json", "r") as f:
+        with open(users_json_path, "r") as f:
             users_json = json.load(f)
         for user in users_json.get("sources", []):
             user_app = str(user["app"])
@@ -117,31 +594,124 @@ def save_allocation_to_json(best_solution, app_json_path, net_json_path, output_
     except Exception as e:
         print("WARNING: Patch allocDefinitionGA gagal:", e)
 
-def run_GA(ec, cnf_):
+def saveBestAllocation(best, ec, outputPath):
+    """Simpan alokasi solusi terbaik memakai file skenario EnvConfig (default: data/*.json)."""
+    save_allocation_to_json(
+        best,
+        getattr(ec, "app_json_path", "data/appDefinition.json"),
+        getattr(ec, "net_json_path", "data/networkDefinition.json"),
+        outputPath,
+        getattr(ec, "users_json_path", "data/usersDefinition.json")
+    )
+
+# Opsi GAConfig yang bekerja per generasi pada satu populasi dan belum ada di model pulau
+ISLAND_UNSUPPORTED_OPTIONS = ("stagnationGenerations", "diversityFloor", "timeBudgetSeconds", "evaluationBudget",
+                              "checkpointPath", "telemetryPath")
+
+def run_GA(ec, cnf_, resumeFrom=None, outputPath="data/allocDefinitionGA.json"):
+    """
+    Jalankan GA dan simpan solusi terbaik ke outputPath (default data/allocDefinitionGA.json).
+    resumeFrom: path checkpoint (lihat GAConfig.checkpointPath) untuk melanjutkan run yang terputus.
+    """
     pop_size = cnf_.numberOfSolutionsInWorkers
     generations = cnf_.numberOfGenerations
     randomseed = cnf_.randomSeed4Optimization[0] if hasattr(cnf_, "randomSeed4Optimization") else 42
-    
-    rng = numpy.random.RandomState(randomseed)
-    ga_pop = GAPopulation(pop_size, rng, ec, cnf_)
 
+    if getattr(cnf_, "numberOfIslands", 1) > 1:
+        unsupported = [name for name in ISLAND_UNSUPPORTED_OPTIONS if getattr(cnf_, name, None) is not None]
+        if resumeFrom is not None:
+            unsupported.append("resumeFrom")
+        if unsupported:
+            raise ValueError(f"Model pulau (numberOfIslands > 1) belum mendukung {unsupported}; set ke None atau jalankan tanpa pulau")
+
+    eliteSize = getattr(cnf_, "eliteSize", 0)
+    if not 0 <= eliteSize < pop_size:
+        # eliteSize >= ukuran populasi: tidak ada anak yang dibuat, populasi hanya berisi arsip elit
+        raise ValueError(f"eliteSize harus 0 <= eliteSize < numberOfSolutionsInWorkers ({pop_size}), bukan {eliteSize}")
+    if getattr(cnf_, "optimizationMode", "single") == "nsga2" and getattr(cnf_, "evolutionMode", "generational") == "steadyState":
+        raise ValueError("evolutionMode 'steadyState' belum didukung optimizationMode 'nsga2'; pakai 'generational'")
+
+    warmStartPath = getattr(cnf_, "warmStartPath", None)
+    if warmStartPath:
+        from warmStart import prepareWarmStart, warmStartSolutions
+        reference = prepareWarmStart(ec, cnf_)
+
+    populationClass = GAPopulation
+    if getattr(cnf_, "optimizationMode", "single") == "nsga2":
+        from nsga2 import NSGA2Population
+        populationClass = NSGA2Population
+
+    if getattr(cnf_, "numberOfIslands", 1) > 1:
+        from GAislands import runIslandModel
+        best = runIslandModel(ec, cnf_, randomseed, populationClass, reference if warmStartPath else None)
+        print("[GA] Evolusi selesai.")
+        print("Fitness:", best.getFitness())
+        saveBestAllocation(best, ec, outputPath)
+        return best
+
+    initStart = time.perf_counter()
+    if resumeFrom is not None:
+        ga_pop, startGeneration = loadCheckpoint(resumeFrom, ec, cnf_, populationClass)
+    else:
+        seedSequence = rootSeedSequence(randomseed)
+        rng = makeGenerator(seedSequence)
+        initialSolutions = warmStartSolutions(rng, ec, cnf_, reference, pop_size) if warmStartPath else None
+        ga_pop = populationClass(pop_size, rng, ec, cnf_, initialSolutions=initialSolutions, seedSequence=seedSequence)
+        startGeneration = 0
+    checkpointPath = getattr(cnf_, "checkpointPath", None)
+    checkpointInterval = getattr(cnf_, "checkpointInterval", 10)
+    stopping = StoppingCriteria(cnf_)
+    if resumeFrom is not None:
+        stopping.setState(ga_pop.checkpointExtra)
+    ga_pop.stopReason = f"{generations} generasi (numberOfGenerations) selesai"
+
+    telemetryPath = getattr(cnf_, "telemetryPath", None)
+    telemetry = RunTelemetry(getattr(cnf_, "telemetryCapacity", 1000)) if telemetryPath else None
+    summary, phaseTimes = takeSummary(), takePhaseTimes()
+    if telemetry is not None and resumeFrom is not None:
+        # Generasi 0..startGeneration sudah tercatat sebelum checkpoint disimpan
+        telemetry.resume(ga_pop, ga_pop.checkpointTelemetry)
+    elif telemetry is not None:
+        telemetry.record(startGeneration, ga_pop, summary, phaseTimes, time.perf_counter() - initStart)
+    print(f"[GA] Ringkasan inisialisasi: {formatSummary(summary)}")
     print(f"[GA] Mulai evolusi selama {generations} generasi...")
-    for gen in range(generations):
-        print(f"[GA] Generasi {gen+1} dimulai...")
-        ga_pop.evolve()
-        best = ga_pop.getBest()
-        print(f"[GA] Generasi {gen+1} selesai. Fitness terbaik: {best.getFitness()}")
+    try:
+        for gen in range(startGeneration, generations):
+            print(f"[GA] Generasi {gen+1} dimulai...")
+            generationStart = time.perf_counter()
+            ga_pop.evolve()
+            generationSeconds = time.perf_counter() - generationStart
+            best = ga_pop.getBest()
+            print(f"[GA] Generasi {gen+1} selesai. Fitness terbaik: {best.getFitness()}")
+            summary, phaseTimes = takeSummary(), takePhaseTimes()
+            if telemetry is not None:
+                telemetry.record(gen + 1, ga_pop, summary, phaseTimes, generationSeconds)
+            print(f"[GA] Ringkasan generasi {gen+1}: {formatSummary(summary)}")
+            reason = stopping.check(ga_pop)
+            if checkpointPath and ((gen + 1) % checkpointInterval == 0 or gen + 1 == generations or reason):
+                saveCheckpoint(checkpointPath, ga_pop, gen + 1, stopping.getState(),
+                               telemetry.rows() if telemetry is not None else None)
+            if reason:
+                ga_pop.stopReason = f"{reason} (generasi {gen+1})"
+                break
+    finally:
+        ga_pop.close()
+        if telemetry is not None:
+            csvPath, npzPath = telemetry.save(telemetryPath)
+            print(f"[GA] Telemetri {min(telemetry.recorded, len(telemetry.buffer))} generasi disimpan ke {csvPath} dan {npzPath}")
 
-    print("[GA] Evolusi selesai.")
+    print(f"[GA] Evolusi selesai. Kriteria berhenti: {ga_pop.stopReason}")
+    if ga_pop.cache is not None:
+        stats = ga_pop.cache.stats()
+        print(f"[GA] Fitness cache: {stats['hits']} hit, {stats['misses']} miss (hit rate {stats['hitRate']:.1%}), {stats['size']} entri")
+    if hasattr(ga_pop, "getParetoFront"):
+        print("[GA] Front Pareto akhir:", [sol.getFitness() for sol in ga_pop.getParetoFront()])
+    if ga_pop.getBest().constraintHandling != "repair" and ga_pop.getBest().getTotalViolation() > 0:
+        print(f"[GA] PERINGATAN: solusi terbaik masih melanggar constraint: {ga_pop.getBest().getViolations().tolist()}")
     print("[GA] Solusi terbaik akhir:")
     print(ga_pop.getBest().getChromosome())
     print("Fitness:", ga_pop.getBest().getFitness())
 
     # Simpan alokasi ke file JSON sesuai format
-    save_allocation_to_json(
-        ga_pop.getBest(),
-        "data/appDefinition.json",
-        "data/networkDefinition.json",
-        "data/allocDefinitionGA.json"
-    )
+    saveBestAllocation(ga_pop.getBest(), ec, outputPath)
     return ga_pop.getBest()
\ No newline at end of file
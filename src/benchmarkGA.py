@@ -0,0 +1,308 @@
+"""
+Benchmark GA (micro + macro) untuk berbagai ukuran topologi.
+
+Skenario disintesis dengan experimentGenerator (topologi scale-free bergaya GLP,
+user, aplikasi) ke folder sementara, jadi tidak butuh jaringan maupun file
+topologi tambahan. Tiap skenario dijalankan di proses terpisah agar peak memory
+(ru_maxrss) terukur per skenario dan kegagalan satu skenario tidak menghentikan
+yang lain.
+
+Contoh:
+    python benchmarkGA.py                       # semua ukuran default
+    python benchmarkGA.py --sizes 50:20 200:20  # node:app
+    python benchmarkGA.py --compare data/benchmark/lama.json
+"""
+import io
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import contextlib
+import subprocess
+import multiprocessing
+import numpy
+import networkx as nx
+
+# (jumlah node, jumlah aplikasi). Ukuran terbesar butuh peak RSS sekitar 3.3 GB (populasi 10):
+# tensor kromosom uint8 (individu x service x node) tidak pernah di-upcast ke int64
+DEFAULT_SIZES = [(50, 20), (200, 20), (400, 50), (2000, 200), (10000, 500)]
+# Matriks jarak N x N tidak dihitung di atas ukuran ini (objektif default tidak memakainya)
+DISTANCE_NODE_LIMIT = 2000
+PHASES = ("initialization", "selection", "crossover", "repair", "mutation", "fitness", "generation")
+
+# =======================
+# Sintesis Skenario
+# =======================
+
+def writeGLPTopology(path, numberOfNodes, numberOfGateways, seed):
+    """
+    Tulis topologi format aShiip/GLP ("id (level)  [tetangga]", id mulai 1).
+    Level dari peringkat derajat: node berderajat tertinggi menjadi core (level 1),
+    numberOfGateways node berderajat terendah menjadi gateway (level 4), tempat user berada.
+    Mengembalikan id cloud (0-based), yaitu node dengan derajat tertinggi.
+    """
+    G = nx.barabasi_albert_graph(numberOfNodes, 2, seed=seed)
+    order = sorted(G.nodes, key=lambda n: (-G.degree[n], n))
+    numberOfCore = max(1, int(round(0.04 * numberOfNodes)))
+    level = {}
+    for rank, node in enumerate(order):
+        if rank < numberOfCore:
+            level[node] = 1
+        elif rank >= numberOfNodes - numberOfGateways:
+            level[node] = 4
+        elif rank < numberOfCore + (numberOfNodes - numberOfCore - numberOfGateways) // 2:
+            level[node] = 2
+        else:
+            level[node] = 3
+    with open(path, "w") as f:
+        f.write(f"GLP Model (sintetis)\n Size : {numberOfNodes}\n\n")
+        for node in sorted(G.nodes):
+            neighbours = ", ".join(str(n + 1) for n in sorted(G.neighbors(node)))
+            f.write(f"{node + 1} ({level[node]})  [{neighbours}]\n")
+    return order[0]
+
+def admitUsers(userJson, appJson, netJson, fillFactor=0.5):
+    """
+    Buang user yang module tujuannya (penempatan wajib) tidak muat lagi di node user-nya,
+    dengan batas fillFactor dari RAM node. Tanpa ini, topologi besar hampir pasti punya
+    gateway yang tidak feasible dan inisialisasi GA gagal.
+    """
+    ram = {entity["id"]: entity["RAM"] * fillFactor for entity in netJson["entity"]}
+    moduleRam = {}
+    for app in appJson:
+        for message in app["message"]:
+            if message["s"] == "None":
+                target = next(module for module in app["module"] if module["name"] == message["d"])
+                moduleRam[(app["name"], message["name"])] = (target["name"], target["RAM"])
+    placed = set()
+    admitted = []
+    for user in userJson["sources"]:
+        module, need = moduleRam[(user["app"], user["message"])]
+        key = (user["app"], module, user["id_resource"])
+        if key not in placed:
+            if ram[user["id_resource"]] < need:
+                continue
+            ram[user["id_resource"]] -= need
+            placed.add(key)
+        admitted.append(user)
+    return {"sources": admitted}
+
+def generateScenario(directory, numberOfNodes, numberOfApps, seed):
+    """Bangkitkan networkDefinition/usersDefinition/appDefinition.json di directory."""
+    import experimentGenerator as generator
+    random.seed(seed)
+    numberOfGateways = max(int(round(0.075 * numberOfNodes)), min(numberOfNodes // 2, numberOfApps))
+    topologyPath = os.path.join(directory, "topology.txt")
+    idcloud = writeGLPTopology(topologyPath, numberOfNodes, numberOfGateways, seed)
+    generator.TOTALNUMBEROFAPPS = numberOfApps
+    # Peluang request diskalakan agar rata-rata user per gateway sama dengan skenario bawaan (20 app)
+    generator.func_REQUESTPROB = repr(0.08 * 20.0 / numberOfApps)
+    with contextlib.redirect_stdout(io.StringIO()):
+        netJson, cloudgatewaysDevices, G = generator.networkGeneration(topologyPath, idcloud, os.path.join(directory, "network.gexf"))
+        userJson = generator.userGeneration(cloudgatewaysDevices, G)
+        appJson = generator.appGeneration()
+    # networkx menyimpan node sesuai urutan kemunculan di file (tetangga lebih dulu), sedangkan
+    # EnvConfig memakai id_resource user sebagai indeks kolom: urutkan agar posisi == id
+    netJson["entity"].sort(key=lambda entity: entity["id"])
+    userJson = admitUsers(userJson, appJson, netJson)
+    paths = {}
+    for name, content in (("app", appJson), ("net", netJson), ("users", userJson)):
+        paths[name] = os.path.join(directory, f"{name}Definition.json")
+        with open(paths[name], "w") as f:
+            json.dump(content, f)
+    return paths
+
+# =======================
+# Pengukuran
+# =======================
+
+class PhaseTimer:
+    def __init__(self):
+        self.phases = {phase: {"seconds": 0.0, "operations": 0} for phase in PHASES}
+
+    @contextlib.contextmanager
+    def measure(self, phase, operations=1):
+        start = time.perf_counter()
+        yield
+        self.phases[phase]["seconds"] += time.perf_counter() - start
+        self.phases[phase]["operations"] += operations
+
+    def report(self):
+        return {
+            phase: dict(values, msPerOperation=1000.0 * values["seconds"] / values["operations"] if values["operations"] else None)
+            for phase, values in self.phases.items()
+        }
+
+def benchmarkScenario(numberOfNodes, numberOfApps, seed, populationSize, generations):
+    """Sintesis satu skenario lalu ukur tiap fase GA. Dijalankan di proses anak."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        # placementMain memuat skenario bawaan saat di-import
+        from placementMain import EnvConfig, GAConfig
+    from solutionGA import SolutionGA
+    from GAworker import GAPopulation
+    from crossoverOperators import batchCrossover
+    from rngStreams import rootSeedSequence, makeGenerator
+
+    directory = tempfile.mkdtemp(prefix=f"benchGA_{numberOfNodes}n_")
+    try:
+        setupStart = time.perf_counter()
+        paths = generateScenario(directory, numberOfNodes, numberOfApps, seed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ec = EnvConfig(paths["app"], paths["net"], paths["users"],
+                           computeDistances=numberOfNodes <= DISTANCE_NODE_LIMIT)
+        setupSeconds = time.perf_counter() - setupStart
+        cnf = GAConfig()
+        cnf.numberOfSolutionsInWorkers = populationSize
+        cnf.fitnessCacheSize = 0  # setiap evaluasi fitness benar-benar dihitung
+        seedSequence = rootSeedSequence(seed)
+        rng = makeGenerator(seedSequence)
+        timer = PhaseTimer()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            # Micro: tiap operator diukur terpisah pada populasi yang sama
+            with timer.measure("initialization", populationSize):
+                solutions = [SolutionGA(rng, ec, cnf) for _ in range(populationSize)]
+            population = GAPopulation(populationSize, rng, ec, cnf, initialSolutions=solutions, seedSequence=seedSequence)
+            with timer.measure("selection", 2 * populationSize):
+                parents = [(population.tournament_selection(), population.tournament_selection()) for _ in range(populationSize)]
+            with timer.measure("crossover", populationSize):
+                children1, children2 = batchCrossover(rng, numpy.stack([p1.chromosome for p1, _ in parents]),
+                                                      numpy.stack([p2.chromosome for _, p2 in parents]), cnf.crossoverOperator)
+            children = [parents[i][0].offspring(children[i]) for children in (children1, children2) for i in range(populationSize)]
+            with timer.measure("repair", len(children)):
+                for child in children:
+                    child.enforceUserConstraints()
+                    child.repairChromosome()
+            with timer.measure("mutation", len(children)):
+                for child in children:
+                    child.mutate()
+            # Repair/mutasi meninggalkan DeltaState yang masih berlaku; tanpa ini fase fitness hanya
+            # mengukur lookup incremental, bukan evaluasi objektif batch
+            for child in children:
+                child.deltaState = None
+            with timer.measure("fitness", len(children)):
+                population.evaluatePopulation(children)
+            # Macro: generasi lengkap
+            with timer.measure("generation", generations):
+                for _ in range(generations):
+                    population.evolve()
+            population.close()
+
+        return {
+            "nodes": numberOfNodes,
+            "apps": numberOfApps,
+            "services": ec.getNumberOfServices(),
+            "users": len(ec.users_json["sources"]),
+            "forcedPlacements": int(len(ec.forcedServices)),
+            "populationSize": populationSize,
+            "generations": generations,
+            "status": "ok",
+            "setupSeconds": setupSeconds,
+            "phases": timer.report(),
+            "bestFitness": population.getBest().getFitness(),
+            "peakRssMB": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        }
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def _scenarioProcess(conn, *args):
+    try:
+        conn.send(benchmarkScenario(*args))
+    except BaseException as e:
+        conn.send({"status": "failed", "error": f"{type(e).__name__}: {e}",
+                   "peakRssMB": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0})
+    finally:
+        conn.close()
+
+def runScenarioIsolated(numberOfNodes, numberOfApps, seed, populationSize, generations):
+    parentConn, childConn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_scenarioProcess,
+                                      args=(childConn, numberOfNodes, numberOfApps, seed, populationSize, generations))
+    process.start()
+    childConn.close()
+    try:
+        result = parentConn.recv()
+    except EOFError:
+        result = {"status": "failed", "error": "proses benchmark berhenti tanpa hasil (mis. kehabisan memori)"}
+    process.join()
+    result.setdefault("nodes", numberOfNodes)
+    result.setdefault("apps", numberOfApps)
+    return result
+
+# =======================
+# Output
+# =======================
+
+def environmentInfo():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+    }
+
+def printResult(result):
+    if result["status"] != "ok":
+        print(f"[Benchmark] {result['nodes']} node / {result['apps']} app: GAGAL ({result['error']})")
+        return
+    print(f"[Benchmark] {result['nodes']} node / {result['apps']} app / {result['services']} service "
+          f"({result['users']} user), peak RSS {result['peakRssMB']:.0f} MB")
+    for phase, values in result["phases"].items():
+        print(f"    {phase:<15} {values['seconds']:9.4f} s  {values['msPerOperation']:10.3f} ms/op  ({values['operations']} op)")
+
+def compareResults(current, previousPath):
+    """Cetak rasio waktu per fase terhadap hasil benchmark sebelumnya (>1 berarti lebih lambat)."""
+    with open(previousPath, "r") as f:
+        previous = {(r["nodes"], r["apps"]): r for r in json.load(f)["results"] if r["status"] == "ok"}
+    print(f"[Benchmark] Perbandingan dengan {previousPath} (rasio waktu baru / lama):")
+    for result in current:
+        old = previous.get((result["nodes"], result["apps"]))
+        if result["status"] != "ok" or old is None:
+            continue
+        ratios = ", ".join(
+            f"{phase} {result['phases'][phase]['seconds'] / old['phases'][phase]['seconds']:.2f}x"
+            for phase in PHASES if old["phases"].get(phase, {}).get("seconds")
+        )
+        print(f"    {result['nodes']} node / {result['apps']} app: {ratios}")
+
+def parseSize(text):
+    nodes, _, apps = text.partition(":")
+    return int(nodes), int(apps or 20)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fase GA pada skenario sintetis berbagai ukuran.")
+    parser.add_argument("--sizes", nargs="+", type=parseSize, default=DEFAULT_SIZES, help="daftar node:app (default: %(default)s)")
+    parser.add_argument("--population", type=int, default=10)
+    parser.add_argument("--generations", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=os.path.join("data", "benchmark", time.strftime("benchmarkGA_%Y%m%d_%H%M%S.json")))
+    parser.add_argument("--compare", help="file JSON hasil benchmark sebelumnya")
+    args = parser.parse_args()
+
+    results = []
+    for numberOfNodes, numberOfApps in args.sizes:
+        print(f"[Benchmark] Menjalankan {numberOfNodes} node / {numberOfApps} app...")
+        result = runScenarioIsolated(numberOfNodes, numberOfApps, args.seed, args.population, args.generations)
+        printResult(result)
+        results.append(result)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"environment": environmentInfo(), "results": results}, f, indent=2)
+    print(f"[Benchmark] Hasil disimpan ke {args.output}")
+    if args.compare:
+        compareResults(results, args.compare)
+    sys.exit(0 if all(result["status"] == "ok" for result in results) else 1)
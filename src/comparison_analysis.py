@@ -262,49 +262,53 @@ def plot_comparison_metrics(ga_metrics, baseline_metrics):
     plt.savefig('Hasil/perbandingan/ga_comparison.png', dpi=300, bbox_inches='tight')
     plt.close()  # Close to save memory
 
-def plot_convergence_analysis():
-    """Plot GA convergence analysis (simulated)"""
-    # Simulate GA convergence data
-    generations = np.arange(0, 101, 5)
-    
-    # Simulated fitness improvement
-    np.random.seed(42)
-    best_fitness = []
-    avg_fitness = []
-    
-    initial_fitness = 1000
-    final_fitness = 200
-    
-    for gen in generations:
-        # Exponential decay with noise
-        progress = gen / 100
-        best_fit = initial_fitness * np.exp(-3 * progress) + final_fitness + np.random.normal(0, 10)
-        avg_fit = best_fit + 50 + np.random.normal(0, 20)
-        
-        best_fitness.append(max(final_fitness, best_fit))
-        avg_fitness.append(max(best_fit + 20, avg_fit))
+def plot_convergence_analysis(telemetry_path="data/telemetryGA.csv"):
+    """Plot GA convergence from the per-generation telemetry written by run_GA (GAConfig.telemetryPath)"""
+    if not os.path.exists(telemetry_path):
+        print(f"⚠️  Telemetry {telemetry_path} not found, set GAConfig.telemetryPath = 'data/telemetryGA' and run placementMain.py first. Skipping convergence plot.")
+        return
+    telemetry = pd.read_csv(telemetry_path)
+    generations = telemetry['generation']
     
     # Create convergence plot
-    plt.figure(figsize=(12, 6))
+    plt.figure(figsize=(18, 6))
     
-    plt.subplot(1, 2, 1)
-    plt.plot(generations, best_fitness, 'g-', linewidth=2, label='Best Fitness', marker='o')
-    plt.plot(generations, avg_fitness, 'b--', linewidth=2, label='Average Fitness', marker='s')
+    plt.subplot(1, 3, 1)
+    plt.plot(generations, telemetry['bestFitness'], 'g-', linewidth=2, label='Best Fitness', marker='o')
+    plt.plot(generations, telemetry['meanFitness'], 'b--', linewidth=2, label='Average Fitness', marker='s')
     plt.xlabel('Generation')
     plt.ylabel('Fitness Value (Lower is Better)')
     plt.title('GA Convergence Analysis', fontsize=14, fontweight='bold')
+    plt.legend(loc='upper left')
+    plt.grid(True, alpha=0.3)
+    diversity_axis = plt.gca().twinx()
+    diversity_axis.plot(generations, telemetry['diversity'], color='gray', linestyle=':', linewidth=1.5, label='Diversity')
+    diversity_axis.set_ylabel('Population Diversity (Hamming)')
+    diversity_axis.legend(loc='upper right')
+    
+    # Constraint failures over generations (repair mode: failed checks, penalty modes: infeasible offspring)
+    plt.subplot(1, 3, 2)
+    plt.plot(generations, telemetry['constraintFailures'], 'r-', linewidth=2, marker='D', label='Failed Constraint Checks')
+    plt.plot(generations, telemetry['infeasible'], 'm--', linewidth=2, marker='x', label='Infeasible Offspring')
+    plt.plot(generations, telemetry['crossoverRetries'] + telemetry['mutationAttempts'], 'k:', linewidth=1.5, label='Crossover/Mutation Attempts')
+    plt.xlabel('Generation')
+    plt.ylabel('Count per Generation')
+    plt.title('Constraint Satisfaction Over Time', fontsize=14, fontweight='bold')
     plt.legend()
     plt.grid(True, alpha=0.3)
     
-    # Constraint violations over generations
-    plt.subplot(1, 2, 2)
-    constraint_violations = [30 - int(gen * 0.3) for gen in generations]
-    constraint_violations = [max(0, cv) for cv in constraint_violations]
-    
-    plt.plot(generations, constraint_violations, 'r-', linewidth=2, marker='D')
+    # Wall time per phase (phases can overlap: crossover/mutation include their repairs; zeros hidden on log scale)
+    plt.subplot(1, 3, 3)
+    for phase in ['selection', 'crossover', 'repair', 'mutation', 'evaluation', 'localSearch']:
+        column = f'{phase}Seconds'
+        if column in telemetry and telemetry[column].sum() > 0:
+            plt.plot(generations, telemetry[column].where(telemetry[column] > 0) * 1000, linewidth=1.5, label=phase)
+    plt.plot(generations, telemetry['generationSeconds'] * 1000, 'k-', linewidth=2, label='generation')
     plt.xlabel('Generation')
-    plt.ylabel('Constraint Violations')
-    plt.title('Constraint Satisfaction Over Time', fontsize=14, fontweight='bold')
+    plt.ylabel('Time (ms)')
+    plt.yscale('log')
+    plt.title('Time per Phase', fontsize=14, fontweight='bold')
+    plt.legend()
     plt.grid(True, alpha=0.3)
     
     plt.tight_layout()
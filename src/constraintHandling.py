@@ -0,0 +1,36 @@
+import numpy
+from objectiveRegistry import batchNodeResourceUse
+
+# =======================
+# Constraint Handling
+# =======================
+# "repair" (default): operator GA memperbaiki dan mengulang sampai offspring feasible.
+# "penalty": offspring dipakai apa adanya, fitness tiap objektif ditambah
+#            penaltyWeight * total pelanggaran.
+# "feasibilityRules": aturan Deb, feasible selalu menang atas infeasible, sesama
+#            infeasible dibandingkan total pelanggaran, sesama feasible dibandingkan fitness.
+CONSTRAINT_HANDLING_MODES = ("repair", "penalty", "feasibilityRules")
+
+# Urutan kolom vektor pelanggaran
+VIOLATION_NAMES = ("overload", "unplacedServices", "missingUserPlacements")
+
+def getConstraintHandling(cnf) -> str:
+    mode = getattr(cnf, "constraintHandling", "repair")
+    if mode not in CONSTRAINT_HANDLING_MODES:
+        raise ValueError(f"constraintHandling '{mode}' tidak dikenal. Pilihan: {CONSTRAINT_HANDLING_MODES}")
+    return mode
+
+def batchConstraintViolations(chromosomes: numpy.ndarray, infrastructure: dict,
+                              forcedServices: numpy.ndarray, forcedNodes: numpy.ndarray) -> numpy.ndarray:
+    """
+    Besar pelanggaran tiap individu, bentuk (populasi x 3), kolom sesuai VIOLATION_NAMES:
+    kelebihan RAM relatif terhadap kapasitas (dijumlah per node), jumlah service tanpa
+    replika, dan jumlah penempatan wajib user yang hilang. Nol semua = feasible.
+    """
+    nodeResources = numpy.asarray(infrastructure['nodeResource'], dtype=numpy.int64)
+    excess = numpy.maximum(batchNodeResourceUse(chromosomes, infrastructure) - nodeResources, 0)
+    violations = numpy.empty((chromosomes.shape[0], len(VIOLATION_NAMES)), dtype=numpy.float64)
+    violations[:, 0] = (excess / numpy.maximum(nodeResources, 1)).sum(axis=1)
+    violations[:, 1] = (~chromosomes.any(axis=2)).sum(axis=1)
+    violations[:, 2] = (chromosomes[:, forcedServices, forcedNodes] == 0).sum(axis=1)
+    return violations
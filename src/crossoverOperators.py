@@ -0,0 +1,56 @@
+import numpy
+from typing import Tuple
+
+# =======================
+# Swap Masks
+# =======================
+# Semua operator bekerja pada batch pasangan parent (P x S x N) dan menghasilkan
+# mask boolean: True = gen ditukar antar parent. Seluruh titik potong diambil dengan
+# satu panggilan RNG per batch, bukan per service.
+
+def _cutPoints(rng: numpy.random.Generator, length: int, shape: tuple) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Pasangan titik potong first <= second di [0, length); ekuivalen randint(length) lalu randint(first, length)."""
+    draws = rng.random((2,) + shape)
+    first = (draws[0] * length).astype(numpy.intp)
+    second = first + (draws[1] * (length - first)).astype(numpy.intp)
+    return first, second
+
+def twoPointMask(rng: numpy.random.Generator, pairs: int, numberOfServices: int, numberOfNodes: int) -> numpy.ndarray:
+    """Two-point per service: segmen node [first, second] tiap baris service ditukar."""
+    first, second = _cutPoints(rng, numberOfNodes, (pairs, numberOfServices))
+    nodeIds = numpy.arange(numberOfNodes)
+    return (nodeIds >= first[..., None]) & (nodeIds <= second[..., None])
+
+def uniformMask(rng: numpy.random.Generator, pairs: int, numberOfServices: int, numberOfNodes: int) -> numpy.ndarray:
+    """Uniform: tiap gen ditukar dengan peluang 0.5."""
+    return rng.random((pairs, numberOfServices, numberOfNodes)) < 0.5
+
+def serviceBlockMask(rng: numpy.random.Generator, pairs: int, numberOfServices: int, numberOfNodes: int) -> numpy.ndarray:
+    """Service-block: baris service [first, second] ditukar utuh (alokasi satu service tidak terpecah)."""
+    first, second = _cutPoints(rng, numberOfServices, (pairs,))
+    serviceIds = numpy.arange(numberOfServices)
+    rowMask = (serviceIds >= first[:, None]) & (serviceIds <= second[:, None])
+    return numpy.broadcast_to(rowMask[:, :, None], (pairs, numberOfServices, numberOfNodes))
+
+CROSSOVER_OPERATORS = {
+    "twoPoint": twoPointMask,
+    "uniform": uniformMask,
+    "serviceBlock": serviceBlockMask,
+}
+
+def getCrossoverOperator(name: str):
+    if name not in CROSSOVER_OPERATORS:
+        raise ValueError(f"Operator crossover '{name}' tidak dikenal. Pilihan: {sorted(CROSSOVER_OPERATORS)}")
+    return CROSSOVER_OPERATORS[name]
+
+def batchCrossover(rng: numpy.random.Generator, parents1: numpy.ndarray, parents2: numpy.ndarray,
+                   operator: str = "twoPoint") -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Crossover seluruh mating pool sekaligus.
+    parents1, parents2: (P x S x N); mengembalikan dua array anak (P x S x N).
+    """
+    pairs, numberOfServices, numberOfNodes = parents1.shape
+    swapMask = getCrossoverOperator(operator)(rng, pairs, numberOfServices, numberOfNodes)
+    children1 = numpy.where(swapMask, parents2, parents1)
+    children2 = numpy.where(swapMask, parents1, parents2)
+    return children1, children2
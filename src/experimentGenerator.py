@@ -55,7 +55,7 @@ myDeadlines = [487203.22, 487203.22,487203.22,474.51,302.05,831.04,793.26,1582.2
 
 #pathGML ="topology/test_GLP.gml"
 
-def networkGeneration(pathTXT,idcloud): 
+def networkGeneration(pathTXT,idcloud,gexfPath="topology/tempora-network.gexf"): 
     #****************************************************************************************************
     #generation of the network topology
     #****************************************************************************************************
@@ -86,7 +86,7 @@ def networkGeneration(pathTXT,idcloud):
                 for i in range(2, len(node_ids)):
                     G.add_edge(node, int(node_ids[i])-1)
     
-    nx.write_gexf(G,"topology/tempora-network.gexf")
+    nx.write_gexf(G,gexfPath)
     nodeResources = {}
     nodeSpeed = {}
     nodePower_min = {}
@@ -253,7 +253,7 @@ def appGeneration():
     
         
         #appsDeadlines[i]=eval(func_APPDEADLINE)
-        appsDeadlines[i] = myDeadlines[i]
+        appsDeadlines[i] = myDeadlines[i % len(myDeadlines)] # lebih dari 20 app: deadline dipakai berulang
         myApp['id']=i
         myApp['name']=str(i)
         myApp['deadline']=appsDeadlines[i]
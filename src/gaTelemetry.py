@@ -0,0 +1,116 @@
+import os
+import csv
+import numpy
+
+# =======================
+# Telemetri Run GA
+# =======================
+# Satu baris per generasi (generasi 0 = populasi awal) di ring buffer yang dialokasikan
+# sekali di awal run; jika run lebih panjang dari kapasitas, hanya generasi terakhir yang
+# disimpan. Di akhir run buffer ditulis ke <path>.csv dan <path>.npz, dipakai oleh
+# comparison_analysis.plot_convergence_analysis.
+# Sumber nilai:
+# - fitness dan diversitas: populasi setelah generasi selesai (objektif pertama)
+# - jumlah kejadian: counter gaTrace (takeSummary) periode generasi tersebut
+# - waktu fase: gaTrace.takePhaseTimes. Fase bisa bertumpuk: waktu crossover dan mutasi
+#   (mode repair) sudah termasuk repair di dalamnya, dan evaluation termasuk cache lookup.
+# Baris yang sudah tercatat ikut disimpan di checkpoint (GAcheckpoint) dan dipulihkan lewat
+# resume(), sehingga file telemetri run yang dilanjutkan tetap berisi generasi 0..k.
+
+PHASE_NAMES = ("selection", "crossover", "repair", "mutation", "evaluation", "localSearch")
+
+TELEMETRY_DTYPE = numpy.dtype(
+    [("generation", numpy.int64),
+     ("bestFitness", numpy.float64),
+     ("meanFitness", numpy.float64),
+     ("diversity", numpy.float64),
+     ("infeasible", numpy.int64),            # anak infeasible (mode penalty/feasibilityRules)
+     ("constraintFailures", numpy.int64),    # checkConstraints yang gagal
+     ("repairs", numpy.int64),
+     ("crossoverRetries", numpy.int64),
+     ("mutationAttempts", numpy.int64),
+     ("mutationResets", numpy.int64),
+     ("cacheHits", numpy.int64),
+     ("cacheMisses", numpy.int64),
+     ("evaluations", numpy.int64)]
+    + [(f"{name}Seconds", numpy.float64) for name in PHASE_NAMES]
+    + [("generationSeconds", numpy.float64)]
+)
+
+class RunTelemetry:
+    def __init__(self, capacity=1000):
+        self.buffer = numpy.zeros(max(1, capacity), dtype=TELEMETRY_DTYPE)
+        self.recorded = 0  # total baris yang pernah dicatat (bisa melebihi kapasitas)
+        self.lastCache = (0, 0)
+        self.lastEvaluations = 0
+
+    def resume(self, ga_pop, rows=None):
+        """
+        Lanjutkan telemetri run yang di-resume dari checkpoint: pulihkan baris yang tercatat
+        sebelumnya (None: tidak ada di checkpoint) dan jadikan counter kumulatif ga_pop saat ini
+        sebagai titik awal, agar baris berikutnya hanya berisi selisih satu generasi.
+        """
+        for row in (rows if rows is not None else []):
+            self.buffer[self.recorded % len(self.buffer)] = row
+            self.recorded += 1
+        if ga_pop.cache is not None:
+            self.lastCache = (ga_pop.cache.hits, ga_pop.cache.misses)
+        self.lastEvaluations = ga_pop.evaluations
+
+    def record(self, generation, ga_pop, summary, phaseTimes, generationSeconds):
+        """
+        Catat satu generasi. summary: snapshot gaTrace.takeSummary(); phaseTimes: hasil
+        gaTrace.takePhaseTimes(); generationSeconds: waktu dinding generasi ini.
+        """
+        row = self.buffer[self.recorded % len(self.buffer)]
+        fitness = numpy.array([sol.getFitness()[0] for sol in ga_pop.population], dtype=numpy.float64)
+        row["generation"] = generation
+        row["bestFitness"] = ga_pop.getBest().getFitness()[0]
+        row["meanFitness"] = fitness.mean()
+        row["diversity"] = ga_pop.diversity()
+        row["infeasible"] = summary.get("anak_infeasible", 0)
+        row["constraintFailures"] = sum(value for name, value in summary.items() if name.startswith("constraint_gagal"))
+        row["crossoverRetries"] = summary.get("crossover_ulang", 0)
+        row["mutationAttempts"] = summary.get("mutasi_percobaan", 0)
+        row["mutationResets"] = summary.get("mutasi_reset", 0)
+        seconds, calls = phaseTimes
+        row["repairs"] = calls.get("repair", 0)
+        for name in PHASE_NAMES:
+            row[f"{name}Seconds"] = seconds.get(name, 0.0)
+        row["generationSeconds"] = generationSeconds
+        if ga_pop.cache is not None:
+            hits, misses = ga_pop.cache.hits, ga_pop.cache.misses
+            row["cacheHits"] = hits - self.lastCache[0]
+            row["cacheMisses"] = misses - self.lastCache[1]
+            self.lastCache = (hits, misses)
+        row["evaluations"] = ga_pop.evaluations - self.lastEvaluations
+        self.lastEvaluations = ga_pop.evaluations
+        self.recorded += 1
+
+    def rows(self):
+        """Baris tercatat, urut kronologis (paling lama lebih dulu)."""
+        capacity = len(self.buffer)
+        if self.recorded <= capacity:
+            return self.buffer[:self.recorded].copy()
+        start = self.recorded % capacity
+        return numpy.concatenate([self.buffer[start:], self.buffer[:start]])
+
+    def save(self, path):
+        """Tulis <path>.csv dan <path>.npz (array per kolom). Mengembalikan kedua path."""
+        rows = self.rows()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        csvPath, npzPath = f"{path}.csv", f"{path}.npz"
+        with open(csvPath, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(TELEMETRY_DTYPE.names)
+            writer.writerows(row.tolist() for row in rows)
+        numpy.savez_compressed(npzPath, **{name: rows[name] for name in TELEMETRY_DTYPE.names})
+        return csvPath, npzPath
+
+def loadTelemetry(path):
+    """Baca telemetri dari <path>.npz (atau path .npz langsung) sebagai dict nama kolom -> array."""
+    if not path.endswith(".npz"):
+        path = f"{path}.npz"
+    with numpy.load(path) as data:
+        return {name: data[name] for name in data.files}
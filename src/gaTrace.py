@@ -0,0 +1,66 @@
+"""
+Tracing ringan untuk hot path GA: logger berlevel (modul `logging`) dan counter agregat.
+
+Pesan per individu dikirim di level DEBUG dengan argumen lazy (%-format), sehingga
+tidak ada string yang dibangun jika level DEBUG tidak aktif. Kejadian yang sering
+(mutasi, crossover, constraint gagal, ...) cukup dihitung lewat count() dan
+diringkas sekali per generasi lewat takeSummary(). Waktu per fase (seleksi, crossover,
+repair, mutasi, evaluasi, ...) diakumulasi dengan timedPhase/phase: cukup dua panggilan
+perf_counter per pemanggilan fungsi.
+"""
+import time
+import logging
+import functools
+import contextlib
+from collections import Counter
+
+counters = Counter()
+phaseSeconds = Counter()
+phaseCalls = Counter()
+
+def getLogger(name):
+    return logging.getLogger(name)
+
+def count(name, n=1):
+    counters[name] += n
+
+def takeSummary(reset=True):
+    """Ambil snapshot counter (dict terurut nama) dan reset untuk periode berikutnya."""
+    snapshot = dict(sorted(counters.items()))
+    if reset:
+        counters.clear()
+    return snapshot
+
+def formatSummary(snapshot):
+    return ", ".join(f"{name}={value}" for name, value in snapshot.items()) or "-"
+
+def timedPhase(name):
+    """Decorator: akumulasi waktu dan jumlah panggilan fungsi ke fase `name`."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                phaseSeconds[name] += time.perf_counter() - start
+                phaseCalls[name] += 1
+        return wrapper
+    return decorator
+
+@contextlib.contextmanager
+def phase(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phaseSeconds[name] += time.perf_counter() - start
+        phaseCalls[name] += 1
+
+def takePhaseTimes(reset=True):
+    """Snapshot (detik per fase, jumlah panggilan per fase) dan reset untuk periode berikutnya."""
+    snapshot = (dict(phaseSeconds), dict(phaseCalls))
+    if reset:
+        phaseSeconds.clear()
+        phaseCalls.clear()
+    return snapshot
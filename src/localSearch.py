@@ -0,0 +1,174 @@
+import numpy
+from gaTrace import count
+
+# =======================
+# Memetic Local Search
+# =======================
+# First-improvement local search untuk individu terbaik tiap generasi. Untuk satu
+# service, seluruh tetangga add (replika baru), drop (hapus replika) dan move
+# (pindah replika) dinilai sekaligus dengan operasi vektor:
+# - resource usage: O(1) per move dari kapasitas node asal/tujuan
+# - jumlah instance: O(1) per move
+# - jarak ke client: O(client) per move dari jarak replika terdekat dan kedua terdekat
+# Hanya move yang feasible (kapasitas, minimal satu replika, penempatan wajib user)
+# yang dipertimbangkan, sehingga individu tetap feasible.
+
+class LocalSearch:
+    def __init__(self, template, cnf, rng):
+        """template: SolutionGA mana pun di populasi (sumber data infrastruktur bersama)."""
+        self.rng = rng
+        self.maxMoves = getattr(cnf, "localSearchMaxMoves", 50)
+        self.acceptance = "dominance" if getattr(cnf, "optimizationMode", "single") == "nsga2" else "lexicographic"
+        # Delta objektif gabungan (weightedSumObjective) = jumlah berbobot delta komponennya
+        self.deltaTerms = [[(component.name, weight) for component, weight in objective.components]
+                           if objective.components is not None else [(objective.name, 1.0)]
+                           for objective in template.objectives]
+        self.objectiveNames = [name for terms in self.deltaTerms for name, _ in terms]
+        unsupported = [name for name in self.objectiveNames if name not in MOVE_DELTAS]
+        if unsupported:
+            raise ValueError(f"Local search belum mendukung objektif {unsupported}. Didukung: {sorted(MOVE_DELTAS)}")
+        self.numberOfServices = template.numberOfServices
+        self.numberOfNodes = template.numberOfNodes
+        self.serviceResources = template.serviceResources
+        self.nodeResources = template.nodeResources
+        # 1/kapasitas per node, 0 untuk node tanpa kapasitas (sama dengan resourceUsageFromLoad)
+        self.inverseCapacity = numpy.zeros(self.numberOfNodes)
+        numpy.divide(1.0, self.nodeResources, out=self.inverseCapacity, where=self.nodeResources > 0)
+        self.forcedMask = numpy.zeros((self.numberOfServices, self.numberOfNodes), dtype=bool)
+        self.forcedMask[template.forcedServices, template.forcedNodes] = True
+        clientNodes = list(template.infrastructure['clientNodes'])
+        self.clientDistances = None
+        if "meanEdgeDistance" in self.objectiveNames and clientNodes:
+            self.clientDistances = numpy.asarray(template.infrastructure['Gdistances'], dtype=numpy.float64)[:, clientNodes]
+        self.referenceChromosome = template.infrastructure.get('referenceChromosome')
+
+    def improve(self, solution):
+        """
+        Kembalikan salinan solution yang sudah diperbaiki (fitness terisi), atau None jika
+        tidak ada move yang memperbaiki. Kromosom solution asli tidak diubah.
+        """
+        candidate = solution.offspring(solution.chromosome.copy())
+        state = candidate.getDeltaState()
+        current = numpy.array(solution.getFitness(), dtype=numpy.float64)
+        moves = 0
+        improvedInPass = True
+        while improvedInPass and moves < self.maxMoves:
+            improvedInPass = False
+            for service in self.rng.permutation(self.numberOfServices):
+                move = self.firstImprovingMove(candidate, state, int(service), current)
+                if move is None:
+                    continue
+                rows, cols, newValues = move
+                candidate.applyChanges(rows, cols)
+                current = newValues
+                moves += 1
+                improvedInPass = True
+                if moves >= self.maxMoves:
+                    break
+        count("ls_move", moves)
+        if moves == 0:
+            return None
+        # Nilai akhir dihitung ulang lewat jalur incremental agar identik dengan evaluasi biasa
+        candidate.setFitness([objective.incremental(candidate) for objective in candidate.objectives])
+        return candidate
+
+    def firstImprovingMove(self, solution, state, service, current):
+        """Move pertama (urutan: drop, move, add) yang memperbaiki fitness untuk satu service."""
+        placed = numpy.flatnonzero(solution.chromosome[service])
+        if len(placed) == 0:
+            return None
+        resource = self.serviceResources[service]
+        fits = (state.nodeResUse + resource <= self.nodeResources) & (solution.chromosome[service] == 0)
+        addNodes = numpy.flatnonzero(fits)
+        removable = placed[~self.forcedMask[service, placed]]
+        dropNodes = removable if len(placed) > 1 else removable[:0]
+        moveFrom = numpy.repeat(removable, len(addNodes))
+        moveTo = numpy.tile(addNodes, len(removable))
+        numberOfMoves = len(dropNodes) + len(moveFrom) + len(addNodes)
+        if numberOfMoves == 0:
+            return None
+        count("ls_tetangga", numberOfMoves)
+        context = (self, state, service, placed, dropNodes, moveFrom, moveTo, addNodes)
+        newValues = current[None, :] + numpy.column_stack([
+            sum(weight * MOVE_DELTAS[name](*context) for name, weight in terms) for terms in self.deltaTerms
+        ])
+        improving = numpy.flatnonzero(self.improves(newValues, current))
+        if len(improving) == 0:
+            return None
+        best = improving[0]
+        if best < len(dropNodes):
+            rows, cols = [service], [dropNodes[best]]
+        elif best < len(dropNodes) + len(moveFrom):
+            i = best - len(dropNodes)
+            rows, cols = [service, service], [moveFrom[i], moveTo[i]]
+        else:
+            rows, cols = [service], [addNodes[best - len(dropNodes) - len(moveFrom)]]
+        return numpy.array(rows, dtype=numpy.intp), numpy.array(cols, dtype=numpy.intp), newValues[best]
+
+    def improves(self, newValues, current, tolerance=1e-12):
+        """Mask move yang lebih baik dari current (leksikografis, atau dominasi pada mode nsga2)."""
+        better = newValues < current - tolerance
+        worse = newValues > current + tolerance
+        if self.acceptance == "dominance":
+            return better.any(axis=1) & ~worse.any(axis=1)
+        result = numpy.zeros(len(newValues), dtype=bool)
+        undecided = numpy.ones(len(newValues), dtype=bool)
+        for k in range(newValues.shape[1]):
+            result |= undecided & better[:, k]
+            undecided &= ~better[:, k] & ~worse[:, k]
+        return result
+
+# =======================
+# Delta Objektif per Move
+# =======================
+# Tiap fungsi mengembalikan perubahan nilai objektif untuk semua move satu service,
+# berurutan [drop..., move..., add...].
+
+def _deltaMeanResourceUsage(search, state, service, placed, dropNodes, moveFrom, moveTo, addNodes):
+    scale = search.serviceResources[service] / float(search.numberOfNodes)
+    inverse = search.inverseCapacity
+    return numpy.concatenate([-inverse[dropNodes], inverse[moveTo] - inverse[moveFrom], inverse[addNodes]]) * scale
+
+def _deltaMeanNumberOfInstances(search, state, service, placed, dropNodes, moveFrom, moveTo, addNodes):
+    step = 1.0 / search.numberOfServices
+    return numpy.concatenate([numpy.full(len(dropNodes), -step), numpy.zeros(len(moveFrom)), numpy.full(len(addNodes), step)])
+
+def _deltaMeanEdgeDistance(search, state, service, placed, dropNodes, moveFrom, moveTo, addNodes):
+    numberOfMoves = len(dropNodes) + len(moveFrom) + len(addNodes)
+    if search.clientDistances is None:
+        return numpy.zeros(numberOfMoves)
+    D = search.clientDistances
+    replicas = len(placed)
+    sortedDistances = numpy.sort(D[placed], axis=0)
+    nearest = sortedDistances[0]
+    secondNearest = sortedDistances[1] if replicas > 1 else numpy.full(D.shape[1], numpy.inf)
+    old = nearest.sum() / replicas
+
+    def withoutReplica(nodes):
+        # Jarak terdekat ke tiap client jika replika di `nodes` dihapus (node x client)
+        return numpy.where(D[nodes] == nearest[None, :], secondNearest[None, :], nearest[None, :])
+
+    dropped = withoutReplica(dropNodes).sum(axis=1) / max(replicas - 1, 1)
+    if len(moveFrom):
+        removable = numpy.unique(moveFrom)
+        remaining = withoutReplica(removable)
+        fromIndex = numpy.searchsorted(removable, moveFrom)
+        moved = numpy.minimum(remaining[fromIndex], D[moveTo]).sum(axis=1) / replicas
+    else:
+        moved = numpy.empty(0)
+    added = numpy.minimum(nearest[None, :], D[addNodes]).sum(axis=1) / (replicas + 1)
+    return (numpy.concatenate([dropped, moved, added]) - old) / search.numberOfServices
+
+def _deltaMigrationCost(search, state, service, placed, dropNodes, moveFrom, moveTo, addNodes):
+    # Flip satu sel: +1 jika sel tadinya sama dengan referensi, -1 jika tadinya berbeda
+    reference = search.referenceChromosome[service].astype(numpy.float64)
+    dropDelta = 1.0 - 2.0 * reference    # 1 -> 0
+    addDelta = 2.0 * reference - 1.0     # 0 -> 1
+    return numpy.concatenate([dropDelta[dropNodes], dropDelta[moveFrom] + addDelta[moveTo], addDelta[addNodes]]) / search.numberOfServices
+
+MOVE_DELTAS = {
+    "meanResourceUsage": _deltaMeanResourceUsage,
+    "meanNumberOfInstances": _deltaMeanNumberOfInstances,
+    "meanEdgeDistance": _deltaMeanEdgeDistance,
+    "migrationCost": _deltaMigrationCost,
+}
@@ -0,0 +1,58 @@
+import os
+import hashlib
+import numpy
+import networkx as nx
+
+# =======================
+# All-pairs distance matrix
+# =======================
+# Matriks jarak antar node (indeks = posisi entity di networkDefinition.json, sama
+# dengan kolom kromosom). Dihitung sekali lalu disimpan di disk dengan kunci hash
+# file network, sehingga run berikutnya pada topologi yang sama cukup memuat .npz.
+
+def _linkLatency(link, messageBytes):
+    # Sama dengan perhitungan latency link di yafs core: transmit + propagation
+    return messageBytes / (link["BW"] * 1000000.0) + link["PR"]
+
+def computeDistanceMatrices(net_json, messageBytes):
+    """Hitung matriks hop-count dan latency (PR + bytes/BW) berukuran (node x node)."""
+    nodeIds = [entity["id"] for entity in net_json["entity"]]
+    nodeId2idx = {nodeId: idx for idx, nodeId in enumerate(nodeIds)}
+    G = nx.Graph()
+    G.add_nodes_from(range(len(nodeIds)))
+    for link in net_json["link"]:
+        G.add_edge(nodeId2idx[link["s"]], nodeId2idx[link["d"]], latency=_linkLatency(link, messageBytes))
+
+    numberOfNodes = len(nodeIds)
+    hops = numpy.full((numberOfNodes, numberOfNodes), numpy.inf)
+    latency = numpy.full((numberOfNodes, numberOfNodes), numpy.inf)
+    for source, lengths in nx.all_pairs_shortest_path_length(G):
+        hops[source, list(lengths.keys())] = list(lengths.values())
+    for source, lengths in nx.all_pairs_dijkstra_path_length(G, weight="latency"):
+        latency[source, list(lengths.keys())] = list(lengths.values())
+    return hops, latency
+
+def loadDistanceMatrices(net_json_path, net_json, messageBytes, cacheDir=None):
+    """
+    Muat matriks jarak dari cache disk atau hitung jika belum ada.
+    Kunci cache: sha256 isi file network + ukuran pesan acuan.
+    """
+    with open(net_json_path, "rb") as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(repr(float(messageBytes)).encode())
+    if cacheDir is None:
+        cacheDir = os.path.join(os.path.dirname(os.path.abspath(net_json_path)), "cache")
+    cachePath = os.path.join(cacheDir, f"distances_{digest.hexdigest()[:16]}.npz")
+    if os.path.exists(cachePath):
+        with numpy.load(cachePath) as data:
+            return data["hops"], data["latency"]
+
+    print(f"[EnvConfig] Menghitung matriks jarak {len(net_json['entity'])} node...")
+    hops, latency = computeDistanceMatrices(net_json, messageBytes)
+    os.makedirs(cacheDir, exist_ok=True)
+    # Tulis ke file sementara dulu lalu rename, agar cache tidak pernah setengah jadi
+    tmpPath = cachePath + f".{os.getpid()}.tmp"
+    with open(tmpPath, "wb") as f:
+        numpy.savez(f, hops=hops, latency=latency)
+    os.replace(tmpPath, cachePath)
+    return hops, latency
@@ -0,0 +1,149 @@
+import numpy
+from GAworker import GAPopulation, PopulationIndex
+from gaTrace import timedPhase
+
+# =======================
+# NSGA-II Multi-Objective GA
+# =======================
+# Semua objektif diminimalkan, sama dengan SolutionGA.dominatesTo. Sorting dan
+# crowding distance divektorisasi dengan NumPy sehingga tetap cepat untuk
+# populasi 500+ (matriks dominasi N x N dihitung dalam satu operasi broadcast).
+
+def dominanceMatrix(F: numpy.ndarray, violations: numpy.ndarray = None) -> numpy.ndarray:
+    """
+    dominates[i, j] = True jika individu i mendominasi individu j.
+    Jika violations (total pelanggaran per individu) diberikan, dipakai constrained domination
+    (aturan Deb): feasible mendominasi infeasible, sesama infeasible dibandingkan pelanggaran.
+    """
+    lessEqual = (F[:, None, :] <= F[None, :, :]).all(axis=2)
+    lessThan = (F[:, None, :] < F[None, :, :]).any(axis=2)
+    dominates = lessEqual & lessThan
+    if violations is not None:
+        violations = numpy.asarray(violations, dtype=numpy.float64)
+        bothFeasible = (violations[:, None] == 0) & (violations[None, :] == 0)
+        dominates = numpy.where(bothFeasible, dominates, violations[:, None] < violations[None, :])
+    return dominates
+
+def fastNonDominatedSort(F: numpy.ndarray, violations: numpy.ndarray = None):
+    """
+    Fast non-dominated sorting (Deb et al.), O(M N^2) dalam bentuk vektor.
+    Mengembalikan (rank per individu, list front berisi indeks individu).
+    """
+    F = numpy.asarray(F, dtype=numpy.float64)
+    dominates = dominanceMatrix(F, violations)
+    dominatedCount = dominates.sum(axis=0)
+    rank = numpy.full(len(F), -1, dtype=numpy.int64)
+    fronts = []
+    current = numpy.flatnonzero(dominatedCount == 0)
+    while len(current) > 0:
+        rank[current] = len(fronts)
+        fronts.append(current)
+        dominatedCount = dominatedCount - dominates[current].sum(axis=0)
+        dominatedCount[rank >= 0] = -1
+        current = numpy.flatnonzero(dominatedCount == 0)
+    return rank, fronts
+
+def crowdingDistance(F: numpy.ndarray) -> numpy.ndarray:
+    """Crowding distance untuk individu-individu dalam satu front."""
+    F = numpy.asarray(F, dtype=numpy.float64)
+    n = len(F)
+    distance = numpy.zeros(n)
+    if n <= 2:
+        distance[:] = numpy.inf
+        return distance
+    for m in range(F.shape[1]):
+        order = numpy.argsort(F[:, m], kind='stable')
+        values = F[order, m]
+        distance[order[0]] = distance[order[-1]] = numpy.inf
+        span = values[-1] - values[0]
+        if span > 0 and numpy.isfinite(span):
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+def chooseFrontMember(front, preference="knee"):
+    """
+    Pilih satu anggota front Pareto untuk diekspor.
+    preference: indeks objektif (minimum objektif itu, seri dipecah objektif lain),
+    atau "knee" (terdekat ke titik ideal setelah normalisasi tiap objektif).
+    """
+    if preference == "knee":
+        F = numpy.array([sol.getFitness() for sol in front], dtype=numpy.float64)
+        ideal = F.min(axis=0)
+        span = F.max(axis=0) - ideal
+        span[span == 0] = 1.0
+        return front[int(numpy.argmin(numpy.linalg.norm((F - ideal) / span, axis=1)))]
+    objective = int(preference)
+    return min(front, key=lambda s: (s.getFitness()[objective], s.getFitness()))
+
+class NSGA2Population(GAPopulation):
+    """GAPopulation dengan seleksi NSGA-II: rank non-dominasi + crowding distance."""
+
+    def __init__(self, pop_size, rng, ec, cnf, initialSolutions=None, seedSequence=None):
+        super().__init__(pop_size, rng, ec, cnf, initialSolutions, seedSequence)
+        self.updateRanking()
+
+    def constraintViolations(self, solutions):
+        """Total pelanggaran per individu untuk constrained domination (None jika mode bukan feasibilityRules)."""
+        if getattr(self.cnf, "constraintHandling", "repair") != "feasibilityRules":
+            return None
+        return numpy.array([sol.getTotalViolation() for sol in solutions])
+
+    def updateRanking(self):
+        F = numpy.array([sol.getFitness() for sol in self.population], dtype=numpy.float64)
+        self.rank, self.fronts = fastNonDominatedSort(F, self.constraintViolations(self.population))
+        self.crowding = numpy.zeros(len(self.population))
+        for front in self.fronts:
+            self.crowding[front] = crowdingDistance(F[front])
+        self.index = PopulationIndex(self.population)
+
+    @timedPhase("selection")
+    def tournament_selection(self):
+        # Crowded tournament: rank lebih kecil menang, jika sama crowding lebih besar menang
+        a, b = self.rng.choice(len(self.population), 2, replace=False)
+        if (self.rank[a], -self.crowding[a]) <= (self.rank[b], -self.crowding[b]):
+            return self.population[a]
+        return self.population[b]
+
+    def evolve(self):
+        print("[GA-NSGA2] Evolusi generasi baru...")
+        popSize = len(self.population)
+        offspring = self.breedOffspring(popSize)
+        self.evaluatePopulation(offspring)
+        # Seleksi (mu + lambda): parent dan offspring bersaing berdasarkan front lalu crowding
+        combined = self.population + offspring
+        F = numpy.array([sol.getFitness() for sol in combined], dtype=numpy.float64)
+        _, fronts = fastNonDominatedSort(F, self.constraintViolations(combined))
+        selected = []
+        for front in fronts:
+            if len(selected) + len(front) <= popSize:
+                selected.extend(front.tolist())
+            else:
+                distance = crowdingDistance(F[front])
+                remaining = popSize - len(selected)
+                selected.extend(front[numpy.argsort(-distance, kind='stable')[:remaining]].tolist())
+            if len(selected) >= popSize:
+                break
+        self.population = [combined[i] for i in selected]
+        self.updateRanking()
+        if self.applyLocalSearch():
+            self.updateRanking()
+        print(f"[GA-NSGA2] Evolusi generasi selesai. Ukuran front Pareto: {len(self.fronts[0])}")
+
+    def localSearchSlots(self, k):
+        # k individu terbaik menurut rank non-dominasi lalu crowding distance
+        return numpy.lexsort((-self.crowding, self.rank))[:k].tolist()
+
+    def immigrate(self, solutions):
+        """Ganti individu dengan rank/crowding terburuk dengan pendatang, lalu hitung ulang ranking."""
+        worst = numpy.lexsort((-self.crowding, self.rank))[::-1].tolist()
+        for idx, sol in zip(worst, solutions):
+            self.population[idx] = sol
+        self.updateRanking()
+        self.updateEliteArchive()
+
+    def getParetoFront(self):
+        """Individu-individu non-dominated (front pertama) pada populasi saat ini."""
+        return [self.population[i] for i in self.fronts[0]]
+
+    def getBest(self):
+        return chooseFrontMember(self.getParetoFront(), getattr(self.cnf, "paretoPreference", "knee"))
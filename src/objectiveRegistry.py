@@ -0,0 +1,192 @@
+import numpy
+
+# =======================
+# Objective Registry
+# =======================
+# Objektif GA didaftarkan dengan nama. Tiap objektif punya varian batch yang
+# menerima tumpukan kromosom (populasi x service x node) beserta dict
+# infrastructure SolutionGA dan mengembalikan satu nilai per individu.
+# Evaluasi per individu memakai varian batch yang sama dengan batch berisi satu
+# kromosom, sehingga hasil evaluasi batch dan per individu selalu identik.
+
+class Objective:
+    def __init__(self, name, batch=None, single=None, incremental=None):
+        if batch is None and single is None:
+            raise ValueError(f"Objektif {name!r} butuh fungsi batch atau single")
+        self.name = name
+        self.batch = batch
+        self.single = single
+        # incremental(solution): hitung dari DeltaState individu dalam O(sel yang berubah)
+        self.incremental = incremental
+        # Objektif gabungan (weightedSumObjective): list (Objective, bobot); None untuk objektif biasa
+        self.components = None
+
+    def evaluate(self, solution) -> float:
+        if self.incremental is not None and solution.getDeltaState(create=False) is not None:
+            return self.incremental(solution)
+        if self.batch is not None:
+            return float(self.batch(solution.chromosome[None], solution.infrastructure)[0])
+        return self.single(solution)
+
+    def __repr__(self):
+        return f"Objective({self.name!r})"
+
+OBJECTIVE_REGISTRY = {}
+
+def registerObjective(name, batch=None, single=None, incremental=None):
+    """
+    Daftarkan objektif baru. batch(chromosomes, infrastructure) dan/atau single(solution);
+    incremental(solution) opsional, harus memberi nilai yang identik dengan batch.
+    """
+    OBJECTIVE_REGISTRY[name] = Objective(name, batch, single, incremental)
+    return OBJECTIVE_REGISTRY[name]
+
+def getObjective(name):
+    return OBJECTIVE_REGISTRY[name]
+
+def weightedSumObjective(terms):
+    """
+    Objektif skalar sum(bobot * objektif) dari list (nama objektif terdaftar atau Objective, bobot).
+    Didaftarkan dengan nama gabungan (mis. "1*meanResourceUsage+0.1*migrationCost") agar
+    worker evaluasi paralel bisa memakainya lewat getObjective. Varian batch/incremental
+    hanya ada jika semua komponennya punya varian tersebut.
+    """
+    components = [(getObjective(name) if isinstance(name, str) else name, float(weight)) for name, weight in terms]
+    name = "+".join(f"{weight:g}*{objective.name}" for objective, weight in components)
+    batch = None
+    if all(objective.batch is not None for objective, _ in components):
+        batch = lambda chromosomes, infrastructure: sum(weight * objective.batch(chromosomes, infrastructure) for objective, weight in components)
+    incremental = None
+    if all(objective.incremental is not None for objective, _ in components):
+        incremental = lambda solution: sum(weight * objective.incremental(solution) for objective, weight in components)
+    single = lambda solution: sum(weight * objective.evaluate(solution) for objective, weight in components)
+    objective = registerObjective(name, batch=batch, single=single, incremental=incremental)
+    objective.components = components
+    return objective
+
+def resolveObjectives(objectivesFunctions):
+    """
+    Ubah daftar objectivesFunctions EnvConfig menjadi list Objective, cukup sekali saat config dimuat.
+    Entri boleh berupa Objective, nama objektif terdaftar, atau pasangan lama
+    [nama, "self.metode()"]. Pasangan lama dengan nama yang belum terdaftar
+    dikompilasi sekali menjadi code object sebagai fallback.
+    """
+    objectives = []
+    for entry in objectivesFunctions:
+        if isinstance(entry, Objective):
+            objectives.append(entry)
+            continue
+        if isinstance(entry, str):
+            name, expression = entry, None
+        else:
+            name, expression = entry[0], entry[1] if len(entry) > 1 else None
+        if name in OBJECTIVE_REGISTRY:
+            objectives.append(OBJECTIVE_REGISTRY[name])
+        elif expression is not None:
+            code = compile(expression, f"<objective {name}>", "eval")
+            objectives.append(Objective(name, single=lambda solution, code=code: eval(code, {}, {"self": solution})))
+        else:
+            raise KeyError(f"Objektif {name!r} tidak terdaftar")
+    return objectives
+
+# =======================
+# Objektif bawaan (batch)
+# =======================
+
+def batchNodeResourceUse(chromosomes: numpy.ndarray, infrastructure: dict) -> numpy.ndarray:
+    """Total RAM terpakai per node untuk tiap individu, bentuk (populasi x node)."""
+    # einsum dengan dtype int64 menghindari salinan int64 seluruh tensor kromosom (matmul meng-upcast uint8)
+    return numpy.einsum('s,psn->pn', numpy.asarray(infrastructure['serviceResource'], dtype=numpy.int64), chromosomes,
+                        dtype=numpy.int64, casting='unsafe')
+
+def resourceUsageFromLoad(nodeResUse: numpy.ndarray, nodeResources: numpy.ndarray) -> numpy.ndarray:
+    usage = numpy.zeros(nodeResUse.shape, dtype=numpy.float64)
+    numpy.divide(nodeResUse, nodeResources, out=usage, where=nodeResources > 0)
+    return usage.mean(axis=-1)
+
+def batchMeanResourceUsage(chromosomes: numpy.ndarray, infrastructure: dict) -> numpy.ndarray:
+    nodeResources = numpy.asarray(infrastructure['nodeResource'], dtype=numpy.int64)
+    return resourceUsageFromLoad(batchNodeResourceUse(chromosomes, infrastructure), nodeResources)
+
+def batchMeanNumberOfInstances(chromosomes: numpy.ndarray, infrastructure: dict) -> numpy.ndarray:
+    numInstances = chromosomes.sum(axis=(1, 2), dtype=numpy.int64)
+    return numInstances / float(chromosomes.shape[1])
+
+def minReplicaDistances(chromosomes: numpy.ndarray, distances: numpy.ndarray):
+    """
+    Jarak dari tiap client ke replika terdekat, hanya untuk (individu, service) yang punya replika.
+    distances: kolom matriks jarak untuk client saja (node x client).
+    Mengembalikan (individu, service, jarak minimum bentuk (pasangan x client)).
+    Reduksi dilakukan atas sel kromosom yang bernilai 1 (biasanya 1-3 replika per service),
+    bukan atas semua node.
+    """
+    individuals, services, nodes = numpy.nonzero(chromosomes)
+    if len(nodes) == 0:
+        return individuals, services, numpy.empty((0, distances.shape[1]), dtype=distances.dtype)
+    # nonzero mengurutkan sel per (individu, service), sehingga replika satu service bersebelahan
+    cells = individuals * chromosomes.shape[1] + services
+    starts = numpy.flatnonzero(numpy.concatenate(([True], cells[1:] != cells[:-1])))
+    minimum = numpy.minimum.reduceat(distances[nodes], starts, axis=0)
+    return individuals[starts], services[starts], minimum
+
+def batchServiceEdgeDistance(chromosomes: numpy.ndarray, infrastructure: dict) -> numpy.ndarray:
+    """Kontribusi jarak tiap service, bentuk (populasi x service). Tiap sel dihitung independen."""
+    clientNodes = list(infrastructure['clientNodes'])
+    totalDistance = numpy.zeros(chromosomes.shape[:2], dtype=numpy.float64)
+    if clientNodes:
+        if infrastructure['Gdistances'] is None:
+            raise ValueError("meanEdgeDistance butuh matriks jarak; buat EnvConfig dengan computeDistances=True")
+        # Kolom matriks jarak (node x node) untuk client saja
+        distances = numpy.asarray(infrastructure['Gdistances'], dtype=numpy.float64)[:, clientNodes]
+        individuals, services, minimum = minReplicaDistances(chromosomes, distances)
+        # Dijumlah berurutan client demi client (bukan penjumlahan pairwise NumPy) agar nilai fitness
+        # identik dengan run sebelumnya
+        totalDistance[individuals, services] = numpy.ascontiguousarray(minimum.T).sum(axis=0)
+    numInstances = chromosomes.sum(axis=2, dtype=numpy.int64)
+    perService = numpy.full(totalDistance.shape, numpy.inf)
+    numpy.divide(totalDistance, numInstances, out=perService, where=numInstances > 0)
+    return perService
+
+def batchMeanEdgeDistance(chromosomes: numpy.ndarray, infrastructure: dict) -> numpy.ndarray:
+    return batchServiceEdgeDistance(chromosomes, infrastructure).sum(axis=-1) / float(chromosomes.shape[1])
+
+def batchMigrationCost(chromosomes: numpy.ndarray, infrastructure: dict) -> numpy.ndarray:
+    """Rata-rata jumlah instance yang ditambah/dihapus per service dibanding alokasi referensi (warm start)."""
+    reference = infrastructure.get('referenceChromosome')
+    if reference is None:
+        raise ValueError("migrationCost butuh alokasi referensi; set GAConfig.warmStartPath")
+    changed = (chromosomes != reference).sum(axis=(1, 2), dtype=numpy.int64)
+    return changed / float(chromosomes.shape[1])
+
+# =======================
+# Objektif bawaan (incremental)
+# =======================
+# Memakai beban node / jumlah replika / jarak per service yang di-cache di DeltaState
+# dan diperbarui oleh SolutionGA.applyChanges. Rumus akhirnya sama dengan versi batch.
+
+def incrementalMeanResourceUsage(solution) -> float:
+    state = solution.getDeltaState()
+    return float(resourceUsageFromLoad(state.nodeResUse[None], solution.nodeResources)[0])
+
+def incrementalMeanNumberOfInstances(solution) -> float:
+    state = solution.getDeltaState()
+    return float(state.replicas.sum() / float(len(state.replicas)))
+
+def incrementalMeanEdgeDistance(solution) -> float:
+    state = solution.getDeltaState()
+    if state.serviceDistance is None:
+        state.serviceDistance = batchServiceEdgeDistance(solution.chromosome[None], solution.infrastructure)[0]
+    elif state.dirtyServices:
+        # Hanya service yang berubah sejak evaluasi terakhir yang dihitung ulang
+        rows = numpy.fromiter(state.dirtyServices, dtype=numpy.intp)
+        state.serviceDistance[rows] = batchServiceEdgeDistance(solution.chromosome[rows][None], solution.infrastructure)[0]
+    state.dirtyServices.clear()
+    return float(state.serviceDistance[None].sum(axis=-1)[0] / float(len(state.serviceDistance)))
+
+registerObjective("meanResourceUsage", batch=batchMeanResourceUsage, incremental=incrementalMeanResourceUsage)
+registerObjective("meanNumberOfInstances", batch=batchMeanNumberOfInstances, incremental=incrementalMeanNumberOfInstances)
+registerObjective("meanEdgeDistance", batch=batchMeanEdgeDistance, incremental=incrementalMeanEdgeDistance)
+# Selisih terhadap referensi cukup murah dihitung ulang penuh; versi incremental dipakai agar
+# jalur incremental objektif lain tetap aktif
+registerObjective("migrationCost", batch=batchMigrationCost,
+                  incremental=lambda solution: float(batchMigrationCost(solution.chromosome[None], solution.infrastructure)[0]))
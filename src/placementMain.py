@@ -1,8 +1,15 @@
 from GAworker import run_GA
+from GAbatch import runBatch
+from objectiveRegistry import resolveObjectives
+from networkDistances import loadDistanceMatrices
 import json
+import numpy
 
 class EnvConfig:
-    def __init__(self, app_json_path, net_json_path, users_json_path):
+    def __init__(self, app_json_path, net_json_path, users_json_path, distanceMetric="latency", computeDistances=True):
+        self.app_json_path = app_json_path
+        self.net_json_path = net_json_path
+        self.users_json_path = users_json_path
         with open(app_json_path, "r") as f:
             self.app_json = json.load(f)
         with open(net_json_path, "r") as f:
@@ -27,8 +34,28 @@ class EnvConfig:
             for module in app["module"]:
                 self.serviceResources.append(module.get("RAM", 1))
         self.objectivesFunctions = [["meanResourceUsage", "self.meanResourceUsage()"]]
-        self.Gdistances = {}
-        self.clientNodes = []
+        self.objectives = resolveObjectives(self.objectivesFunctions)
+        # Indeks kolom kromosom = posisi entity di networkDefinition.json
+        self.nodeIds = [entity["id"] for entity in self.net_json["entity"]]
+        self.nodeId2idx = {nodeId: idx for idx, nodeId in enumerate(self.nodeIds)}
+        # Node tempat user berada, dipakai objektif meanEdgeDistance
+        self.clientNodes = sorted({
+            self.nodeId2idx[user["id_resource"]] for user in self.users_json["sources"]
+            if user["id_resource"] in self.nodeId2idx
+        })
+        # Matriks jarak (node x node): hop-count dan latency (PR + bytes/BW, bytes = rata-rata ukuran pesan)
+        self.Ghops = None
+        self.Glatency = None
+        self.Gdistances = None
+        if computeDistances:
+            messageBytes = numpy.mean([msg["bytes"] for app in self.app_json for msg in app["message"]])
+            self.Ghops, self.Glatency = loadDistanceMatrices(net_json_path, self.net_json, messageBytes)
+            if distanceMetric == "hops":
+                self.Gdistances = self.Ghops
+            elif distanceMetric == "latency":
+                self.Gdistances = self.Glatency
+            else:
+                raise ValueError(f"distanceMetric harus 'hops' atau 'latency', bukan {distanceMetric!r}")
 
         # --- Mapping kebutuhan user: (app, module_tujuan, node_user) ---
         self.user_module_node = set()
@@ -50,6 +77,41 @@ class EnvConfig:
         
         print(f"[DEBUG] Total user_module_node mappings: {len(self.user_module_node)}")
         print(f"[DEBUG] User mappings: {self.user_module_node}")
+        self.buildUserConstraintIndex()
+
+    def buildUserConstraintIndex(self):
+        """
+        Index constraint user yang dihitung sekali dan dipakai langsung oleh semua operator GA
+        (array read-only, tidak perlu lookup module2idx per panggilan):
+        - forcedServices/forcedNodes: pasangan (service, node) wajib, urut
+        - constrainedServiceMask: service yang menjadi module tujuan user
+        - constrainedNodeMask: node tempat user berada
+        - invalidUserConstraints: entri user_module_node tanpa mapping module atau node di luar range
+        """
+        pairs = set()
+        constrainedServices = set()
+        constrainedNodes = set()
+        invalid = []
+        for (app, mod_dst, node) in sorted(self.user_module_node):
+            idx = self.module2idx.get((app, mod_dst), None)
+            if node < self.numberOfNodes:
+                constrainedNodes.add(node)
+            if idx is not None:
+                constrainedServices.add(idx)
+            if idx is None or node >= self.numberOfNodes:
+                invalid.append((app, mod_dst, node))
+            else:
+                pairs.add((idx, node))
+        pairs = sorted(pairs)
+        self.forcedServices = numpy.array([service for service, _ in pairs], dtype=numpy.intp)
+        self.forcedNodes = numpy.array([node for _, node in pairs], dtype=numpy.intp)
+        self.constrainedServiceMask = numpy.zeros(self.numberOfServices, dtype=bool)
+        self.constrainedServiceMask[list(constrainedServices)] = True
+        self.constrainedNodeMask = numpy.zeros(self.numberOfNodes, dtype=bool)
+        self.constrainedNodeMask[list(constrainedNodes)] = True
+        for array in (self.forcedServices, self.forcedNodes, self.constrainedServiceMask, self.constrainedNodeMask):
+            array.setflags(write=False)
+        self.invalidUserConstraints = tuple(invalid)
 
     def getNumberOfNodes(self):
         return self.numberOfNodes
@@ -60,6 +122,9 @@ class EnvConfig:
     def getObjectivesFunctions(self):
         return self.objectivesFunctions
 
+    def getObjectives(self):
+        return self.objectives
+
     def getNodeResources(self):
         return self.nodeResources
 
@@ -71,11 +136,49 @@ class GAConfig:
     numberOfGenerations = 5
     mutationProbability = 0.2
     randomSeed4Optimization = [42]
+    numberOfEvaluationWorkers = 1  # >1: evaluasi fitness paralel dengan process pool
+    evolutionMode = "generational"  # "generational" atau "steadyState" (hanya optimizationMode "single")
+    eliteSize = 1  # jumlah individu elit yang selalu dibawa ke generasi berikutnya (< numberOfSolutionsInWorkers)
+    optimizationMode = "single"  # "single" atau "nsga2" (multi-objektif)
+    paretoPreference = "knee"  # anggota front yang diekspor: "knee" atau indeks objektif
+    crossoverOperator = "twoPoint"  # "twoPoint", "uniform" atau "serviceBlock"
+    batchCrossover = False  # True: crossover seluruh mating pool dalam satu panggilan vektor
+    constraintHandling = "repair"  # "repair", "penalty" atau "feasibilityRules" (aturan Deb)
+    penaltyWeight = 10.0  # bobot penalty per unit pelanggaran (mode "penalty")
+    localSearchTopK = 0  # >0: local search (add/drop/move replika) untuk k individu terbaik tiap generasi
+    localSearchMaxMoves = 50  # batas move yang diterima per individu per generasi
+    warmStartPath = None  # mis. "data/allocDefinitionGA.json": seed populasi dari alokasi sebelumnya
+    warmStartFraction = 0.5  # porsi populasi awal dari alokasi lama + perturbasinya
+    warmStartPerturbations = 3  # jumlah mutasi per individu perturbasi
+    minimizeMigration = True  # warm start: tambah objektif migrationCost (selisih dari alokasi lama)
+    migrationWeight = 0.1  # mode single: fitness = objektif pertama + migrationWeight * migrationCost (nsga2: objektif Pareto)
+    fitnessCacheSize = 10000  # jumlah maksimum entri cache fitness (0: nonaktif); individu yang dievaluasi incremental tidak lewat cache
+    stagnationGenerations = None  # berhenti jika fitness terbaik tidak membaik selama K generasi
+    diversityFloor = None  # berhenti jika diversitas populasi (Hamming atas gen terpakai, 0-1) di bawah nilai ini
+    timeBudgetSeconds = None  # batas waktu evolusi (detik)
+    evaluationBudget = None  # batas jumlah evaluasi fitness
+    telemetryPath = None  # mis. "data/telemetryGA": telemetri per generasi ke <path>.csv dan <path>.npz
+    telemetryCapacity = 1000  # ring buffer: hanya N generasi terakhir yang disimpan
+    checkpointPath = None  # mis. "data/checkpointGA.npz"; None: tanpa checkpoint
+    checkpointInterval = 10  # simpan checkpoint setiap N generasi
+    numberOfIslands = 1  # >1: model pulau, tiap pulau satu proses
+    migrationInterval = 5  # migrasi setiap M generasi
+    migrationSize = 2  # top-k individu yang bermigrasi
+    migrationTopology = "ring"  # "ring" atau "full"
+    batchScenarios = None  # mis. {"kecil": ("app.json", "net.json", "users.json")}; None: hanya skenario default
+    numberOfBatchProcesses = 1  # jumlah proses untuk run batch (semua seed x skenario)
+    batchOutputDir = "data/batchGA"  # folder alokasi per run dan summary.csv
 
 ec = EnvConfig("data/appDefinition.json", "data/networkDefinition.json", "data/usersDefinition.json")
 cnf_ = GAConfig()
 
 if __name__ == "__main__":
+    if len(cnf_.randomSeed4Optimization) > 1 or cnf_.batchScenarios:
+        scenarios = {"default": ec}
+        if cnf_.batchScenarios:
+            scenarios = {name: EnvConfig(*paths) for name, paths in cnf_.batchScenarios.items()}
+        runBatch(scenarios, cnf_)
+        raise SystemExit(0)
     best_sol = run_GA(ec, cnf_)
     chromosome = best_sol.getChromosome()
 
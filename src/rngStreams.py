@@ -0,0 +1,50 @@
+import json
+import numpy
+
+# =======================
+# Stream RNG Reproducible
+# =======================
+# Semua randomness GA berasal dari satu root seed (GAConfig.randomSeed4Optimization).
+# Stream turunan dibuat dengan SeedSequence.spawn, bukan dengan membagi satu generator:
+# - satu stream per pulau (GAislands)
+# - per populasi: satu stream untuk operator evolusi dan satu stream per individu awal
+# Setiap stream hanya bergantung pada root seed dan posisinya di pohon spawn, sehingga
+# hasil tidak bergantung pada jumlah worker maupun urutan eksekusi paralel.
+
+def rootSeedSequence(seed) -> numpy.random.SeedSequence:
+    return seed if isinstance(seed, numpy.random.SeedSequence) else numpy.random.SeedSequence(seed)
+
+def makeGenerator(seed) -> numpy.random.Generator:
+    """Generator PCG64 dari seed (int) atau SeedSequence."""
+    return numpy.random.Generator(numpy.random.PCG64(rootSeedSequence(seed)))
+
+def spawnGenerators(seedSequence: numpy.random.SeedSequence, n: int) -> list:
+    """n Generator independen dari anak-anak seedSequence (tidak mengonsumsi stream mana pun)."""
+    return [makeGenerator(child) for child in seedSequence.spawn(n)]
+
+# SeedSequence disimpan sendiri oleh pemanggil (mis. GAPopulation.seedSequence), bukan dibaca
+# dari bit_generator.seed_seq yang baru ada sejak NumPy 1.25.
+def getGeneratorState(rng: numpy.random.Generator, seedSequence: numpy.random.SeedSequence) -> str:
+    """
+    State generator sebagai string JSON (disimpan apa adanya di checkpoint): state bit
+    generator ditambah SeedSequence asalnya, agar spawn setelah resume tetap sama.
+    """
+    return json.dumps({
+        "bitGenerator": rng.bit_generator.state,
+        "seedSequence": {
+            "entropy": seedSequence.entropy,
+            "spawnKey": list(seedSequence.spawn_key),
+            "poolSize": seedSequence.pool_size,
+            "childrenSpawned": seedSequence.n_children_spawned,
+        },
+    })
+
+def generatorFromState(state: str):
+    """Kebalikan getGeneratorState: mengembalikan (Generator, SeedSequence)."""
+    state = json.loads(state)
+    seed = state["seedSequence"]
+    seedSequence = numpy.random.SeedSequence(seed["entropy"], spawn_key=seed["spawnKey"],
+                                             pool_size=seed["poolSize"], n_children_spawned=seed["childrenSpawned"])
+    bitGenerator = getattr(numpy.random, state["bitGenerator"]["bit_generator"])()
+    bitGenerator.state = state["bitGenerator"]
+    return numpy.random.Generator(bitGenerator), seedSequence
@@ -1,33 +1,128 @@
 import numpy
 from typing import List, Tuple
 import random
+import heapq
+import logging
+from objectiveRegistry import resolveObjectives, batchMeanResourceUsage, batchMeanNumberOfInstances, batchMeanEdgeDistance, minReplicaDistances
+from gaTrace import getLogger, count, timedPhase
+from crossoverOperators import batchCrossover
+from constraintHandling import getConstraintHandling, batchConstraintViolations
+
+logger = getLogger(__name__)
+
+class DeltaState:
+    """
+    Cache turunan kromosom yang diperbarui inkremental oleh SolutionGA.applyChanges:
+    beban RAM per node, jumlah replika per service, dan kontribusi jarak per service.
+    Hanya berlaku selama SolutionGA.chromosome masih array yang sama.
+    """
+    def __init__(self, solution: 'SolutionGA') -> None:
+        self.chromosome = solution.chromosome
+        self.nodeResUse = solution.nodeResourceUse()
+        self.replicas = solution.chromosome.sum(axis=1, dtype=numpy.int64)
+        self.serviceDistance = None  # dihitung saat pertama dibutuhkan objektif jarak
+        self.dirtyServices = set()
 
 class SolutionGA:
-    def __init__(self, rng: numpy.random.mtrand.RandomState, ec, cnf, solConf: dict = None, solInfr: dict = None) -> None:
-        print("[SolutionGA] Mulai inisialisasi individu baru...")
+    def __init__(self, rng: numpy.random.Generator, ec, cnf, solConf: dict = None, solInfr: dict = None) -> None:
+        count("individu_baru")
+        self.bindEnvironment(rng, ec, cnf)
+        self.initWorker(self.solutionConfig, self.infrastructure)
+        if (solConf is None) and (solInfr is None):
+            self.initCoordinator()
+        elif isinstance(solConf, dict) and isinstance(solInfr, dict):
+            self.initWorker(solConf, solInfr)
+        else:
+            self.initWorker({'numberOfNodes': self.numberOfNodes, 'numberOfServices': self.numberOfServices}, self.infrastructure)
+
+    def bindEnvironment(self, rng: numpy.random.Generator, ec, cnf) -> None:
+        """Siapkan data turunan EnvConfig (resource, infrastructure, objektif) tanpa membuat kromosom."""
         self.randomNG = rng
         self.ec = ec
         self.cnf = cnf
         self.numberOfNodes = self.ec.getNumberOfNodes()
         self.numberOfServices = self.ec.getNumberOfServices()
         self.objectivesFunctions = self.ec.getObjectivesFunctions()
-        self.nodeResources = self.ec.getNodeResources()
-        self.serviceResources = self.ec.getServiceResources()
+        # Objektif sudah di-resolve EnvConfig saat config dimuat
+        self.objectives = self.ec.getObjectives() if hasattr(self.ec, 'getObjectives') else resolveObjectives(self.objectivesFunctions)
+        # Resource disimpan sebagai array int64 agar operasi kromosom bisa divektorisasi
+        self.nodeResources = numpy.asarray(self.ec.getNodeResources(), dtype=numpy.int64)
+        self.serviceResources = numpy.asarray(self.ec.getServiceResources(), dtype=numpy.int64)
         self.infrastructure = {
             'Gdistances': self.ec.Gdistances if hasattr(self.ec, 'Gdistances') else {},
             'clientNodes': self.ec.clientNodes if hasattr(self.ec, 'clientNodes') else [],
             'serviceResource': self.serviceResources,
-            'nodeResource': self.nodeResources
+            'nodeResource': self.nodeResources,
+            'referenceChromosome': getattr(self.ec, 'referenceChromosome', None)
         }
         self.solutionConfig = {'numberOfNodes': self.numberOfNodes, 'numberOfServices': self.numberOfServices}
-        print("[SolutionGA] Memanggil initWorker untuk inisialisasi kromosom...")
-        self.initWorker(self.solutionConfig, self.infrastructure)
-        if (solConf is None) and (solInfr is None):
-            self.initCoordinator()
-        elif isinstance(solConf, dict) and isinstance(solInfr, dict):
-            self.initWorker(solConf, solInfr)
-        else:
-            self.initWorker({'numberOfNodes': self.numberOfNodes, 'numberOfServices': self.numberOfServices}, self.infrastructure)
+        self.constraintHandling = getConstraintHandling(cnf)
+        # Index constraint user dari EnvConfig (read-only, dipakai bersama semua individu)
+        self.forcedServices = self.ec.forcedServices
+        self.forcedNodes = self.ec.forcedNodes
+        self.violations = None
+
+    @classmethod
+    def fromChromosome(cls, rng: numpy.random.Generator, ec, cnf, chromosome) -> 'SolutionGA':
+        """Bangun individu dari kromosom yang sudah ada (mis. hasil dari proses lain) tanpa inisialisasi random."""
+        sol = cls.__new__(cls)
+        sol.bindEnvironment(rng, ec, cnf)
+        sol.chromosome = numpy.array(chromosome, dtype=numpy.uint8)
+        sol.state = 'active'
+        return sol
+
+    def offspring(self, chromosome: numpy.ndarray) -> 'SolutionGA':
+        """
+        Buat individu baru dari kromosom hasil operator genetik.
+        Tidak menjalankan initWorker; data turunan EnvConfig dipakai bersama (by reference)
+        dengan individu ini karena tidak pernah diubah oleh operator GA.
+        """
+        sol = SolutionGA.__new__(SolutionGA)
+        sol.randomNG = self.randomNG
+        sol.ec = self.ec
+        sol.cnf = self.cnf
+        sol.numberOfNodes = self.numberOfNodes
+        sol.numberOfServices = self.numberOfServices
+        sol.objectivesFunctions = self.objectivesFunctions
+        sol.objectives = self.objectives
+        sol.nodeResources = self.nodeResources
+        sol.serviceResources = self.serviceResources
+        sol.infrastructure = self.infrastructure
+        sol.solutionConfig = self.solutionConfig
+        sol.constraintHandling = self.constraintHandling
+        sol.forcedServices = self.forcedServices
+        sol.forcedNodes = self.forcedNodes
+        sol.chromosome = chromosome
+        sol.violations = None
+        sol.deltaState = None
+        sol.state = 'active'
+        return sol
+
+    def getDeltaState(self, create: bool = True) -> DeltaState:
+        """DeltaState yang masih berlaku untuk kromosom saat ini (dibangun ulang jika kromosom diganti)."""
+        state = getattr(self, 'deltaState', None)
+        if state is None or state.chromosome is not self.chromosome:
+            if not create:
+                return None
+            state = self.deltaState = DeltaState(self)
+        return state
+
+    def applyChanges(self, rows: numpy.ndarray, cols: numpy.ndarray) -> None:
+        """
+        Balik (flip) sel kromosom (rows[i], cols[i]); tiap sel paling banyak muncul sekali.
+        Jika DeltaState ada, beban node dan jumlah replika diperbarui dalam O(sel yang berubah).
+        """
+        if len(rows) == 0:
+            return
+        newValues = 1 - self.chromosome[rows, cols]
+        self.chromosome[rows, cols] = newValues
+        self.violations = None
+        state = self.getDeltaState(create=False)
+        if state is not None:
+            sign = newValues.astype(numpy.int64) * 2 - 1
+            numpy.add.at(state.nodeResUse, cols, sign * self.serviceResources[rows])
+            numpy.add.at(state.replicas, rows, sign)
+            state.dirtyServices.update(rows.tolist())
 
     def initCoordinator(self) -> None:
         self.state = 'active'
@@ -36,91 +131,99 @@ class SolutionGA:
         self.state = 'active'
         self.solutionConfig = solConf
         self.infrastructure = solInfr
-        max_attempts = 1000  # batas percobaan
-        attempts = 0
-        satisfiedConstraints = False
-        print("[SolutionGA] Mencari solusi feasible untuk individu baru...")
-        while not satisfiedConstraints and attempts < max_attempts:
-            self.generateRandomChromosome(solConf['numberOfNodes'], solConf['numberOfServices'])
-            satisfiedConstraints = self.checkConstraints()
-            attempts += 1
-            if attempts % 100 == 0:
-                print(f"[SolutionGA] Percobaan ke-{attempts} mencari solusi feasible...")
-        if not satisfiedConstraints:
-            print("[SolutionGA] Gagal menemukan solusi feasible setelah 1000 percobaan!")
+        self.generateFeasibleChromosome(solConf['numberOfNodes'], solConf['numberOfServices'])
+        if self.constraintHandling == "repair" and not self.checkConstraints():
+            logger.error("Gagal membangun solusi feasible!")
             raise Exception("Gagal menemukan solusi feasible pada inisialisasi individu GA.")
-        print(f"[SolutionGA] Solusi feasible ditemukan setelah {attempts} percobaan.")
+        logger.debug("Solusi feasible ditemukan.")
 
-    def generateRandomChromosome(self, numberOfNodes: int, numberOfServices: int) -> None:
-        self.chromosome = []
+    def generateFeasibleChromosome(self, numberOfNodes: int, numberOfServices: int) -> None:
+        """
+        Inisialisasi konstruktif yang selalu feasible (tanpa rejection sampling):
+        1. Module tujuan user ditempatkan dulu di node user.
+        2. Setiap service lain mendapat satu replika wajib (service besar lebih dulu) di node
+           random yang sisa RAM-nya cukup. Jika random buntu, replika wajib diulang dengan
+           best-fit decreasing.
+        3. Baru setelah semua service tertempatkan, tiap service mendapat 0-2 replika tambahan
+           dari sisa kapasitas.
+        Gagal hanya jika best-fit decreasing pun tidak menemukan penempatan.
+        Pada mode penalty/feasibilityRules kapasitas yang tidak cukup tidak menggagalkan
+        inisialisasi; kelebihannya dinilai sebagai pelanggaran.
+        """
+        # Kromosom berupa matriks bit (service x node) bertipe uint8
+        self.chromosome = numpy.zeros((numberOfServices, numberOfNodes), dtype=numpy.uint8)
+        self.violations = None
         node_capacity = self.nodeResources.copy()
-        forced = set()
-        # Siapkan baris kosong untuk semua service
-        for i in range(numberOfServices):
-            self.chromosome.append([0] * numberOfNodes)
-        # Step 1: Tempatkan module tujuan user di node user lebih dulu
-        if hasattr(self.ec, "user_module_node"):
-            for (app, mod_dst, node) in self.ec.user_module_node:
-                idx = self.ec.module2idx.get((app, mod_dst), None)
-                if idx is not None and node < numberOfNodes:
-                    # Cek resource cukup
-                    if node_capacity[node] >= self.serviceResources[idx]:
-                        self.chromosome[idx][node] = 1
-                        node_capacity[node] -= self.serviceResources[idx]
-                        forced.add(idx)
-                    else:
-                        # Tidak cukup resource, biar constraint gagal
-                        pass
-        # Step 2: Generate untuk service lain secara random
-        for iService in range(numberOfServices):
-            if iService in forced:
+        # Step 1: Tempatkan module tujuan user di node user lebih dulu (urutan tetap agar deterministik)
+        for idx, node in zip(self.forcedServices, self.forcedNodes):
+            if node_capacity[node] < self.serviceResources[idx] and self.constraintHandling == "repair":
+                app, mod_dst = self.ec.idx2module[idx]
+                raise Exception(f"Kapasitas node {node} tidak cukup untuk module {mod_dst} (app {app}) milik user.")
+            self.chromosome[idx, node] = 1
+            node_capacity[node] -= self.serviceResources[idx]
+        order = numpy.argsort(-self.serviceResources, kind='stable')
+        unplaced = order[self.chromosome[order].sum(axis=1) == 0]
+        # Step 2: satu replika wajib per service, random dulu lalu best-fit decreasing
+        placement = self.placeSingleReplicas(unplaced, node_capacity, randomChoice=True)
+        if placement is None:
+            count("init_best_fit")
+            placement = self.placeSingleReplicas(unplaced, node_capacity, randomChoice=False)
+        if placement is None:
+            raise Exception("Tidak ada penempatan satu replika per service yang muat di sisa RAM node (best-fit decreasing).")
+        nodes, node_capacity = placement
+        self.chromosome[unplaced, nodes] = 1
+        # Step 3: replika tambahan dari sisa kapasitas. feasible[k, n] = sisa RAM node n >= sizes[k]
+        sizes, sizeIndex = numpy.unique(self.serviceResources, return_inverse=True)
+        feasible = node_capacity[None, :] >= sizes[:, None]
+        for iService in unplaced:
+            extra = self.randomNG.integers(0, 3)
+            if extra == 0:
+                continue
+            candidates = numpy.flatnonzero(feasible[sizeIndex[iService]] & (self.chromosome[iService] == 0))
+            if len(candidates) == 0:
                 continue
-            n_nodes = self.randomNG.randint(1, 4)
-            candidates = [i for i in range(numberOfNodes) if node_capacity[i] >= self.serviceResources[iService]]
-            if len(candidates) < n_nodes:
-                chosen = self.randomNG.choice(numberOfNodes, n_nodes, replace=False)
+            chosen = self.randomNG.choice(candidates, min(extra, len(candidates)), replace=False)
+            self.chromosome[iService, chosen] = 1
+            node_capacity[chosen] -= self.serviceResources[iService]
+            # Perbarui himpunan feasible hanya untuk node yang berubah
+            feasible[:, chosen] = node_capacity[None, chosen] >= sizes[:, None]
+
+    def placeSingleReplicas(self, services: numpy.ndarray, node_capacity: numpy.ndarray, randomChoice: bool):
+        """
+        Satu node untuk tiap service (urutan services dipertahankan): node random dari himpunan
+        feasible, atau node feasible dengan sisa RAM terkecil (best fit). Mengembalikan
+        (node per service, sisa kapasitas) atau None jika ada service yang tidak muat.
+        Pada mode penalty/feasibilityRules service yang tidak muat ditaruh di node dengan sisa RAM terbesar.
+        """
+        node_capacity = node_capacity.copy()
+        nodes = numpy.empty(len(services), dtype=numpy.intp)
+        for i, iService in enumerate(services):
+            resource = self.serviceResources[iService]
+            candidates = numpy.flatnonzero(node_capacity >= resource)
+            if len(candidates) == 0:
+                if self.constraintHandling == "repair":
+                    return None
+                node = int(numpy.argmax(node_capacity))
+            elif randomChoice:
+                node = self.randomNG.choice(candidates)
             else:
-                chosen = self.randomNG.choice(candidates, n_nodes, replace=False)
-            for idx in chosen:
-                self.chromosome[iService][idx] = 1
-                if idx < len(node_capacity):
-                    node_capacity[idx] -= self.serviceResources[iService]
+                node = candidates[numpy.argmin(node_capacity[candidates])]
+            nodes[i] = node
+            node_capacity[node] -= resource
+        return nodes, node_capacity
+
+    def nodeResourceUse(self) -> numpy.ndarray:
+        """Total RAM yang terpakai di tiap node (array int64 sepanjang jumlah node)."""
+        return numpy.einsum('s,sn->n', self.serviceResources, self.chromosome, dtype=numpy.int64, casting='unsafe')
 
     def meanNumberOfInstances(self) -> float:
-        numInstances = sum(sum(serviceAllocation) for serviceAllocation in self.chromosome)
-        return float(numInstances) / float(len(self.chromosome))
+        return float(batchMeanNumberOfInstances(self.chromosome[None], self.infrastructure)[0])
 
     def meanEdgeDistance(self) -> float:
-        finalTotalDistance = 0
-        for serviceAllocation in self.chromosome:
-            closestInstanceDistance = 0
-            numberOfInstances = sum(serviceAllocation)
-            if numberOfInstances > 0:
-                for edgeNodeId in self.infrastructure['clientNodes']:
-                    minDistance = float('inf')
-                    for nodeId, value in enumerate(serviceAllocation):
-                        if value == 1:
-                            distanceBetweenNodes = self.infrastructure['Gdistances'][str(nodeId)][str(edgeNodeId)]
-                            if distanceBetweenNodes < minDistance:
-                                minDistance = distanceBetweenNodes
-                    closestInstanceDistance += minDistance
-                closestInstanceDistance /= float(numberOfInstances)
-            else:
-                closestInstanceDistance = float('inf')
-            finalTotalDistance += closestInstanceDistance
-        return float(finalTotalDistance) / float(len(self.chromosome))
+        return float(batchMeanEdgeDistance(self.chromosome[None], self.infrastructure)[0])
 
     def meanResourceUsage(self) -> float:
-        nodeResUse = [0.0 for _ in range(self.numberOfNodes)]
-        for idServ, serviceAllocation in enumerate(self.chromosome):
-            for idNode, deployed in enumerate(serviceAllocation):
-                if deployed:
-                    nodeResUse[idNode] += self.serviceResources[idServ]
-        usage = []
-        for idNode in range(self.numberOfNodes):
-            cap = self.nodeResources[idNode]
-            usage.append(nodeResUse[idNode] / cap if cap > 0 else 0)
-        return float(sum(usage)) / len(usage)
+        return float(batchMeanResourceUsage(self.chromosome[None], self.infrastructure)[0])
 
     def dominatesTo(self, solB: 'SolutionGA') -> bool:
         atLeastOneBetter = False
@@ -132,13 +235,8 @@ class SolutionGA:
         return atLeastOneBetter
 
     def calculateFitness(self) -> None:
-        print("[SolutionGA] Menghitung fitness individu...")
-        objectives = []
-        for obj in self.objectivesFunctions:
-            objValue = eval(obj[1], {}, {"self": self})
-            objectives.append(objValue)
-        self.fitness = objectives
-        print(f"[SolutionGA] Fitness individu: {self.fitness}")
+        self.fitness = [objective.evaluate(self) for objective in self.objectives]
+        logger.debug("Fitness individu: %s", self.fitness)
 
     def setFitness(self, fitnessValues: List[float]) -> None:
         self.fitness = fitnessValues
@@ -146,63 +244,63 @@ class SolutionGA:
     def getFitness(self) -> List[float]:
         return self.fitness
 
-    def mutationSwapNode(self) -> None:
-        print("[SolutionGA] Mutasi: swap node...")
-        
-        # Buat set untuk melacak node yang terkait user constraint
-        user_constraint_nodes = set()
-        if hasattr(self.ec, "user_module_node"):
-            for (app, mod_dst, node) in self.ec.user_module_node:
-                user_constraint_nodes.add(node)
-        
+    def getViolations(self) -> numpy.ndarray:
+        """Vektor besar pelanggaran constraint (lihat constraintHandling.VIOLATION_NAMES)."""
+        if self.violations is None:
+            self.violations = batchConstraintViolations(self.chromosome[None], self.infrastructure,
+                                                        self.forcedServices, self.forcedNodes)[0]
+        return self.violations
+
+    def getTotalViolation(self) -> float:
+        return float(self.getViolations().sum())
+
+    def getRankKey(self) -> List[float]:
+        """Kunci pembanding individu (lebih kecil lebih baik) sesuai mode constraint handling."""
+        if self.constraintHandling == "feasibilityRules":
+            return [self.getTotalViolation()] + list(self.fitness)
+        return self.fitness
+
+    def mutationSwapNode(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        count("mutasi_swap_node")
         # Pilih node yang tidak melanggar user constraint
-        available_nodes = [n for n in range(self.numberOfNodes) if n not in user_constraint_nodes]
-        
+        available_nodes = numpy.flatnonzero(~self.ec.constrainedNodeMask)
         if len(available_nodes) >= 2:
             node1, node2 = self.randomNG.choice(available_nodes, 2, replace=False)
-            for i in range(self.numberOfServices):
-                # Jangan swap jika service i memiliki user constraint
-                has_user_constraint = False
-                if hasattr(self.ec, "user_module_node"):
-                    for (app, mod_dst, node) in self.ec.user_module_node:
-                        idx = self.ec.module2idx.get((app, mod_dst), None)
-                        if idx == i:
-                            has_user_constraint = True
-                            break
-                
-                if not has_user_constraint:
-                    self.chromosome[i][node1], self.chromosome[i][node2] = self.chromosome[i][node2], self.chromosome[i][node1]
-
-    def mutationSwapService(self) -> None:
-        print("[SolutionGA] Mutasi: swap service...")
-        
-        # Buat set untuk melacak service yang memiliki user constraint
-        user_constraint_services = set()
-        if hasattr(self.ec, "user_module_node"):
-            for (app, mod_dst, node) in self.ec.user_module_node:
-                idx = self.ec.module2idx.get((app, mod_dst), None)
-                if idx is not None:
-                    user_constraint_services.add(idx)
-        
+            # Jangan swap service yang memiliki user constraint
+            rows = numpy.flatnonzero(~self.ec.constrainedServiceMask)
+            # Swap dua kolom = flip sel yang nilainya berbeda di kedua node
+            changedRows = rows[self.chromosome[rows, node1] != self.chromosome[rows, node2]]
+            changes = (numpy.concatenate([changedRows, changedRows]),
+                       numpy.concatenate([numpy.full(len(changedRows), node1), numpy.full(len(changedRows), node2)]))
+            self.applyChanges(*changes)
+            return changes
+        return (numpy.empty(0, dtype=numpy.intp), numpy.empty(0, dtype=numpy.intp))
+
+    def mutationSwapService(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        count("mutasi_swap_service")
         # Pilih service yang tidak memiliki user constraint
-        available_services = [s for s in range(self.numberOfServices) if s not in user_constraint_services]
-        
+        available_services = numpy.flatnonzero(~self.ec.constrainedServiceMask)
         if len(available_services) >= 2:
             s1, s2 = self.randomNG.choice(available_services, 2, replace=False)
-            self.chromosome[s1], self.chromosome[s2] = self.chromosome[s2], self.chromosome[s1]
+            # Swap dua baris = flip sel yang nilainya berbeda di kedua service
+            changedCols = numpy.flatnonzero(self.chromosome[s1] != self.chromosome[s2])
+            changes = (numpy.concatenate([numpy.full(len(changedCols), s1), numpy.full(len(changedCols), s2)]),
+                       numpy.concatenate([changedCols, changedCols]))
+            self.applyChanges(*changes)
+            return changes
+        return (numpy.empty(0, dtype=numpy.intp), numpy.empty(0, dtype=numpy.intp))
 
     def enforceUserConstraints(self):
         """
         Memastikan user constraints selalu terpenuhi pada kromosom.
         Dipanggil setelah crossover atau operasi yang bisa merusak constraint.
         """
-        if hasattr(self.ec, "user_module_node"):
-            for (app, mod_dst, node) in self.ec.user_module_node:
-                idx = self.ec.module2idx.get((app, mod_dst), None)
-                if idx is not None and node < self.numberOfNodes:
-                    # Pastikan module tujuan user ada di node user
-                    self.chromosome[idx][node] = 1
+        # Pastikan module tujuan user ada di node user
+        missing = self.chromosome[self.forcedServices, self.forcedNodes] == 0
+        if missing.any():
+            self.applyChanges(self.forcedServices[missing], self.forcedNodes[missing])
 
+    @timedPhase("repair")
     def repairChromosome(self):
             """
             Memperbaiki kromosom agar:
@@ -210,60 +308,57 @@ class SolutionGA:
             2. Setiap service minimal di-deploy di 1 node
             3. User constraints tetap terjaga (module tujuan user di node user)
             """
-            nodeResUse = [0.0 for _ in range(self.numberOfNodes)]
-            
-            # Buat set untuk melacak constraint user (service_idx, node) yang wajib
-            user_constraints = set()
-            if hasattr(self.ec, "user_module_node"):
-                for (app, mod_dst, node) in self.ec.user_module_node:
-                    idx = self.ec.module2idx.get((app, mod_dst), None)
-                    if idx is not None and node < self.numberOfNodes:
-                        user_constraints.add((idx, node))
-            
-            # Hitung resource awal
-            for idServ, serviceAllocation in enumerate(self.chromosome):
-                for idNode, deployed in enumerate(serviceAllocation):
-                    if deployed:
-                        nodeResUse[idNode] += self.serviceResources[idServ]
+            self.violations = None
+            # Beban tiap node dan jumlah replika tiap service diambil dari DeltaState,
+            # lalu diperbarui secara inkremental setiap ada instance yang dihapus/ditambah
+            state = self.getDeltaState()
+            nodeResUse = state.nodeResUse
+            replicas = state.replicas
             
-            # Repair node overload
-            for idNode in range(self.numberOfNodes):
-                while nodeResUse[idNode] > self.nodeResources[idNode]:
-                    # Cari service yang bisa dihapus dari node ini
-                    found = False
-                    for idServ, serviceAllocation in enumerate(self.chromosome):
-                        if serviceAllocation[idNode]:
-                            # JANGAN hapus jika ini adalah constraint user
-                            if (idServ, idNode) in user_constraints:
-                                continue
-                            # Pastikan service ini masih punya instance di node lain
-                            if sum(self.chromosome[idServ]) > 1:
-                                self.chromosome[idServ][idNode] = 0
-                                nodeResUse[idNode] -= self.serviceResources[idServ]
-                                found = True
-                                break
-                    if not found:
-                        # Tidak bisa repair lagi, break biar constraint gagal
-                        break
+            # Repair node overload: hanya node yang overload di awal yang perlu dicek,
+            # karena menghapus instance tidak pernah menambah beban node lain
+            for idNode in numpy.flatnonzero(nodeResUse > self.nodeResources):
+                # Kandidat eviksi diurutkan dari RAM terbesar agar jumlah instance yang dihapus minimal
+                evictable = self.chromosome[:, idNode].astype(bool)
+                # JANGAN hapus jika ini adalah constraint user
+                evictable[self.forcedServices[self.forcedNodes == idNode]] = False
+                candidates = [(-int(self.serviceResources[idServ]), int(idServ)) for idServ in numpy.flatnonzero(evictable)]
+                heapq.heapify(candidates)
+                while nodeResUse[idNode] > self.nodeResources[idNode] and candidates:
+                    negRes, idServ = heapq.heappop(candidates)
+                    # Pastikan service ini masih punya instance di node lain
+                    if replicas[idServ] > 1:
+                        self.chromosome[idServ, idNode] = 0
+                        nodeResUse[idNode] += negRes
+                        replicas[idServ] -= 1
+                        state.dirtyServices.add(idServ)
+                # Jika masih overload, tidak bisa repair lagi, biar constraint gagal
             
-            # Repair service yang tidak dideploy
-            for idServ, serviceAllocation in enumerate(self.chromosome):
-                if sum(serviceAllocation) == 0:
-                    # Cari node yang masih cukup resource
-                    for idNode in range(self.numberOfNodes):
-                        if nodeResUse[idNode] + self.serviceResources[idServ] <= self.nodeResources[idNode]:
-                            self.chromosome[idServ][idNode] = 1
-                            nodeResUse[idNode] += self.serviceResources[idServ]
-                            break
+            # Repair service yang tidak dideploy (service besar lebih dulu)
+            unplaced = numpy.flatnonzero(replicas == 0)
+            for idServ in unplaced[numpy.argsort(-self.serviceResources[unplaced], kind='stable')]:
+                # Cari node pertama yang masih cukup resource
+                fits = numpy.flatnonzero(nodeResUse + self.serviceResources[idServ] <= self.nodeResources)
+                if len(fits) > 0:
+                    idNode = fits[0]
+                    self.chromosome[idServ, idNode] = 1
+                    nodeResUse[idNode] += self.serviceResources[idServ]
+                    replicas[idServ] += 1
+                    state.dirtyServices.add(int(idServ))
 
+    @timedPhase("mutation")
     def mutate(self) -> None:
-            print("[SolutionGA] Proses mutasi individu...")
+            count("mutasi")
+            mutationOperators = [self.mutationSwapNode, self.mutationSwapService]
+            if self.constraintHandling != "repair":
+                # Mode penalty/feasibilityRules: satu kali mutasi, pelanggaran dinilai saat evaluasi
+                mutationOperators[self.randomNG.integers(len(mutationOperators))]()
+                return
             max_attempts = 100  # batas percobaan mutasi
             attempts = 0
             satisfiedConstraints = False
             while not satisfiedConstraints and attempts < max_attempts:
-                mutationOperators = [self.mutationSwapNode, self.mutationSwapService]
-                mutationOperators[self.randomNG.randint(len(mutationOperators))]()
+                mutationOperators[self.randomNG.integers(len(mutationOperators))]()
                 
                 # Pastikan user constraints selalu terpenuhi setelah mutasi
                 self.enforceUserConstraints()
@@ -271,122 +366,91 @@ class SolutionGA:
                 self.repairChromosome()  # <--- Tambahkan repair di sini
                 satisfiedConstraints = self.checkConstraints()
                 attempts += 1
-                if attempts % 20 == 0:
-                    print(f"[SolutionGA] Mutasi percobaan ke-{attempts}...")
+            count("mutasi_percobaan", attempts)
             if not satisfiedConstraints:
-                print("[SolutionGA] Mutasi gagal menemukan solusi feasible, reset individu!")
+                count("mutasi_reset")
+                logger.debug("Mutasi gagal menemukan solusi feasible setelah %d percobaan, reset individu", attempts)
                 self.initWorker(self.solutionConfig, self.infrastructure)
-            else:
-                print("[SolutionGA] Mutasi menghasilkan solusi feasible.")
 
-    def crossover(self, chromosome: List[list]) -> List['SolutionGA']:
-            print("[SolutionGA] Proses crossover...")
+    @timedPhase("crossover")
+    def crossover(self, chromosome: numpy.ndarray) -> List['SolutionGA']:
+            count("crossover")
+            chromosome = numpy.asarray(chromosome, dtype=numpy.uint8)
             satisfiedConstraints = False
+            operator = getattr(self.cnf, "crossoverOperator", "twoPoint")
+            if self.constraintHandling != "repair":
+                # Tanpa repair dan tanpa retry; offspring infeasible dinilai lewat penalty/aturan Deb
+                children1, children2 = batchCrossover(self.randomNG, self.chromosome[None], chromosome[None], operator)
+                return [self.offspring(children1[0]), self.offspring(children2[0])]
             while not satisfiedConstraints:
-                chr = [0] * 2
-                chr[0], chr[1] = self.twoPointServiceCrossover(self.chromosome, chromosome)
-                solutions = []
-                satisfiedConstraints = True
-                for i in range(len(chr)):
-                    sol = SolutionGA(self.randomNG, self.ec, self.cnf)
-                    sol.infrastructure = self.infrastructure
-                    sol.chromosome = chr[i]
-                    sol.state = 'active'
-                    sol.numberOfNodes = self.numberOfNodes
-                    sol.numberOfServices = self.numberOfServices
-                    sol.objectivesFunctions = self.objectivesFunctions
-                    sol.nodeResources = self.nodeResources
-                    sol.serviceResources = self.serviceResources
-                    
-                    # Pastikan user constraints terpenuhi di offspring
-                    sol.enforceUserConstraints()
-                    
-                    sol.repairChromosome()  # <--- Tambahkan repair di sini
-                    solutions.append(sol)
-                    satisfiedConstraints = satisfiedConstraints and sol.checkConstraints()
+                children1, children2 = batchCrossover(self.randomNG, self.chromosome[None], chromosome[None], operator)
+                solutions = [self.repairedOffspring(children1[0]), self.repairedOffspring(children2[0])]
+                satisfiedConstraints = all(sol.checkConstraints() for sol in solutions)
                 if not satisfiedConstraints:
-                    print("[SolutionGA] Crossover gagal, ulangi proses crossover...")
-            print("[SolutionGA] Crossover menghasilkan solusi feasible.")
+                    count("crossover_ulang")
             return solutions
 
-    def twoPointServiceCrossover(self, chr1: List[list], chr2: List[list]) -> Tuple[List[list], List[list]]:
-        newChild1 = []
-        newChild2 = []
-        for idService in range(len(chr1)):
-            serviceFather1 = chr1[idService]
-            serviceFather2 = chr2[idService]
-            serviceChild1 = []
-            serviceChild2 = []
-            firstCrossoverPoint = self.randomNG.randint(len(serviceFather1))
-            secondCrossoverPoint = self.randomNG.randint(firstCrossoverPoint, len(serviceFather1))
-            for idNode in range(firstCrossoverPoint):
-                serviceChild1.append(serviceFather1[idNode])
-                serviceChild2.append(serviceFather2[idNode])
-            for idNode in range(firstCrossoverPoint, secondCrossoverPoint + 1):
-                serviceChild2.append(serviceFather1[idNode])
-                serviceChild1.append(serviceFather2[idNode])
-            for idNode in range(secondCrossoverPoint + 1, len(serviceFather1)):
-                serviceChild1.append(serviceFather1[idNode])
-                serviceChild2.append(serviceFather2[idNode])
-            newChild1.append(serviceChild1)
-            newChild2.append(serviceChild2)
-        return newChild1, newChild2
+    def repairedOffspring(self, chromosome: numpy.ndarray) -> 'SolutionGA':
+        """Offspring dari kromosom hasil crossover, sudah di-enforce user constraint dan di-repair (belum dicek)."""
+        sol = self.offspring(chromosome)
+        sol.enforceUserConstraints()
+        sol.repairChromosome()
+        return sol
+
+    def twoPointServiceCrossover(self, chr1: numpy.ndarray, chr2: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        # Segmen node [first, second] per service ditukar antar parent, sisanya diwarisi apa adanya
+        children1, children2 = batchCrossover(self.randomNG, chr1[None], chr2[None], "twoPoint")
+        return children1[0], children2[0]
 
     def getChromosome(self) -> List[list]:
-        return self.chromosome
+        """Kromosom dalam bentuk list of list 0/1 (kompatibel dengan pemanggil lama)."""
+        return self.chromosome.tolist()
 
     def checkConstraints(self) -> bool:
+        # Beban node dan jumlah replika dari DeltaState (tidak perlu scan seluruh matriks)
+        state = self.getDeltaState()
         # Constraint 1: Setiap service minimal di-deploy di 1 node
-        for serviceAllocation in self.chromosome:
-            if sum(serviceAllocation) == 0:
-                print("[SolutionGA] Constraint gagal: ada service yang tidak dideploy di node manapun.")
-                return False
+        if not state.replicas.all():
+            count("constraint_gagal_unplaced")
+            logger.debug("Constraint gagal: ada service yang tidak dideploy di node manapun.")
+            return False
         # Constraint 2: Resource usage tiap node tidak boleh melebihi kapasitas
-        nodeResUse = [0.0 for _ in range(self.numberOfNodes)]
-        for idServ, serviceAllocation in enumerate(self.chromosome):
-            for idNode, deployed in enumerate(serviceAllocation):
-                if deployed:
-                    nodeResUse[idNode] += self.serviceResources[idServ]
-        for idNode in range(self.numberOfNodes):
-            if nodeResUse[idNode] > self.nodeResources[idNode]:
-                print(f"[SolutionGA] Constraint gagal: node {idNode} overload (pakai {nodeResUse[idNode]}, kapasitas {self.nodeResources[idNode]})")
-                return False
+        nodeResUse = state.nodeResUse
+        overloaded = numpy.flatnonzero(nodeResUse > self.nodeResources)
+        if len(overloaded) > 0:
+            idNode = overloaded[0]
+            count("constraint_gagal_overload")
+            logger.debug("Constraint gagal: node %s overload (pakai %s, kapasitas %s)", idNode, nodeResUse[idNode], self.nodeResources[idNode])
+            return False
         # Constraint 3: Untuk setiap user, module tujuan user harus dialokasikan di node user
-        for (app, mod_dst, node) in self.ec.user_module_node:
-            idx = self.ec.module2idx.get((app, mod_dst), None)
-            if idx is None:
-                print(f"[SolutionGA] Constraint gagal: mapping (app={app}, module={mod_dst}) tidak ditemukan.")
-                return False
-            if node >= self.numberOfNodes:
-                print(f"[SolutionGA] Constraint gagal: node {node} di luar range node.")
-                return False
-            if self.chromosome[idx][node] != 1:
-                print(f"[SolutionGA] Constraint gagal: module {mod_dst} (app {app}) tidak dialokasikan di node user {node}.")
-                return False
+        if self.ec.invalidUserConstraints:
+            count("constraint_gagal_user")
+            logger.debug("Constraint gagal: mapping user tidak valid (module tidak ditemukan / node di luar range): %s", self.ec.invalidUserConstraints)
+            return False
+        missing = numpy.flatnonzero(self.chromosome[self.forcedServices, self.forcedNodes] != 1)
+        if len(missing) > 0:
+            count("constraint_gagal_user")
+            if logger.isEnabledFor(logging.DEBUG):
+                app, mod_dst = self.ec.idx2module[int(self.forcedServices[missing[0]])]
+                logger.debug("Constraint gagal: module %s (app %s) tidak dialokasikan di node user %s.", mod_dst, app, self.forcedNodes[missing[0]])
+            return False
         return True
     
     def computeNodeResUseGA(self):
         """Hitung resource usage tiap node untuk solusi GA."""
-        self.nodeResUseGA = [0 for _ in range(self.numberOfNodes)]
-        for s, allocation in enumerate(self.chromosome):
-            for n, deployed in enumerate(allocation):
-                if deployed:
-                    self.nodeResUseGA[n] += self.serviceResources[s]
+        self.nodeResUseGA = self.nodeResourceUse().tolist()
 
     def computeStatisticsDistancesRequestGA(self):
         """Hitung statistik distance vs request untuk solusi GA."""
         # Misal: dictionary {distance: jumlah_request}
         self.statisticsDistancesRequestGA = {}
-        for serviceAllocation in self.chromosome:
-            for edgeNodeId in self.infrastructure['clientNodes']:
-                minDistance = float('inf')
-                for nodeId, deployed in enumerate(serviceAllocation):
-                    if deployed:
-                        distance = self.infrastructure['Gdistances'][str(nodeId)][str(edgeNodeId)]
-                        if distance < minDistance:
-                            minDistance = distance
-                if minDistance != float('inf'):
-                    self.statisticsDistancesRequestGA[minDistance] = self.statisticsDistancesRequestGA.get(minDistance, 0) + 1
+        clientNodes = list(self.infrastructure['clientNodes'])
+        if not clientNodes:
+            return
+        distances = numpy.asarray(self.infrastructure['Gdistances'])[:, clientNodes]
+        _, _, minimum = minReplicaDistances(self.chromosome[None], distances)
+        for minDistance in minimum.ravel().tolist():
+            self.statisticsDistancesRequestGA[minDistance] = self.statisticsDistancesRequestGA.get(minDistance, 0) + 1
 
     def computeUnavailableGArnd(self, failuresObj):
         """Ambil unavailableGArnd dari objek failures."""
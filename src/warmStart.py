@@ -0,0 +1,76 @@
+import json
+import numpy
+from objectiveRegistry import resolveObjectives, weightedSumObjective
+from solutionGA import SolutionGA
+
+# =======================
+# Warm Start
+# =======================
+# Re-optimasi setelah perubahan kecil pada usersDefinition.json: alokasi lama
+# (allocDefinitionGA.json) dimuat kembali sebagai kromosom referensi. Sebagian
+# populasi awal diisi alokasi lama dan perturbasinya, dan objektif migrationCost
+# (jumlah sel yang berbeda dari referensi) bisa ditambahkan agar solusi dengan
+# migrasi minimal lebih disukai. Pada mode single, objektif dibandingkan leksikografis
+# sehingga objektif terakhir hanya pemecah seri; migrationCost karena itu digabung ke
+# objektif pertama dengan bobot GAConfig.migrationWeight. Pada mode nsga2 migrationCost
+# menjadi objektif Pareto tersendiri.
+
+def loadAllocationChromosome(ec, path):
+    """
+    Baca file alokasi (format save_allocation_to_json) menjadi kromosom uint8 (service x node).
+    Entri yang module atau node-nya tidak ada lagi di skenario diabaikan.
+    Mengembalikan (kromosom, jumlah entri yang diabaikan).
+    """
+    with open(path, "r") as f:
+        allocation = json.load(f)["initialAllocation"]
+    appId2name = {str(app["id"]): app["name"] for app in ec.app_json}
+    chromosome = numpy.zeros((ec.getNumberOfServices(), ec.getNumberOfNodes()), dtype=numpy.uint8)
+    skipped = 0
+    for entry in allocation:
+        idx = ec.module2idx.get((appId2name.get(str(entry["app"])), entry["module_name"]), None)
+        node = ec.nodeId2idx.get(entry["id_resource"], None)
+        if idx is None or node is None:
+            skipped += 1
+            continue
+        chromosome[idx, node] = 1
+    return chromosome, skipped
+
+def prepareWarmStart(ec, cnf):
+    """
+    Muat alokasi GAConfig.warmStartPath sebagai ec.referenceChromosome dan, jika
+    GAConfig.minimizeMigration, tambahkan migrationCost ke objektif EnvConfig.
+    """
+    reference, skipped = loadAllocationChromosome(ec, cnf.warmStartPath)
+    print(f"[GA] Warm start dari {cnf.warmStartPath}: {int(reference.sum())} instance dimuat, {skipped} entri diabaikan.")
+    ec.referenceChromosome = reference
+    names = [component.name for objective in ec.objectives for component, _ in (objective.components or [(objective, 1.0)])]
+    if getattr(cnf, "minimizeMigration", True) and "migrationCost" not in names:
+        if getattr(cnf, "optimizationMode", "single") == "nsga2":
+            ec.objectivesFunctions = ec.objectivesFunctions + [["migrationCost"]]
+        else:
+            first = ec.objectives[0]
+            weighted = weightedSumObjective([(first.name, 1.0), ("migrationCost", getattr(cnf, "migrationWeight", 0.1))])
+            ec.objectivesFunctions = [weighted] + list(ec.objectivesFunctions[1:])
+        ec.objectives = resolveObjectives(ec.objectivesFunctions)
+    return reference
+
+def warmStartSolutions(rng, ec, cnf, reference, pop_size):
+    """
+    Individu awal dari alokasi referensi: satu salinan yang di-repair terhadap skenario baru,
+    ditambah perturbasinya (warmStartPerturbations kali mutasi) sampai warmStartFraction
+    dari populasi. Sisa populasi tetap dibangun random oleh GAPopulation.
+    """
+    seed = SolutionGA.fromChromosome(rng, ec, cnf, reference)
+    seed.enforceUserConstraints()
+    seed.repairChromosome()
+    if seed.constraintHandling == "repair" and not seed.checkConstraints():
+        print("[GA] PERINGATAN: alokasi warm start tidak bisa di-repair menjadi feasible, populasi awal dibangun random.")
+        return []
+    numberOfSeeds = max(1, int(round(pop_size * getattr(cnf, "warmStartFraction", 0.5))))
+    solutions = [seed]
+    for _ in range(numberOfSeeds - 1):
+        sol = seed.offspring(seed.chromosome.copy())
+        for _ in range(getattr(cnf, "warmStartPerturbations", 3)):
+            sol.mutate()
+        solutions.append(sol)
+    return solutions
@@ -23,6 +23,23 @@ class Selection(object):
         self.transmit = 0.0
         self.lat_acc = 0.0
         self.propagation = 0.0
+        self.routed_messages = 0
+        self.routed_in_second = 0
+        self.current_second = 0
+
+    def count_route(self, sim):
+        """
+        Aggregated counter for routed messages. Instead of logging every message, a summary
+        is logged (INFO) once per simulated second.
+        """
+        self.routed_messages += 1
+        second = int(sim.env.now)
+        if second != self.current_second:
+            if self.routed_in_second:
+                self.logger.info("Routing summary (t=%i): %i messages routed, %i total", self.current_second, self.routed_in_second, self.routed_messages - 1)
+            self.current_second = second
+            self.routed_in_second = 0
+        self.routed_in_second += 1
 
     def get_path(self, sim, app_name, message, topology_src,alloc_DES, alloc_module, traffic, from_des):
 
@@ -114,7 +131,10 @@ class First_ShortestPath(Selection):
         #Among all possible path we choose the smallest
         bestPath = []
         bestDES = []
-        print (DES_dst)
+        self.count_route(sim)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("DES destinations: %s", DES_dst)
         for des in DES_dst:
             dst_node = alloc_DES[des]
             # print "DES Node %i " %dst_node
@@ -122,7 +142,8 @@ class First_ShortestPath(Selection):
             path = list(nx.shortest_path(sim.topology.G, source=node_src, target=dst_node))
             bestPath = [path]
             bestDES  = [des]
-            print (path)
+            if debug:
+                self.logger.debug("Path: %s", path)
 
 
         return bestPath,bestDES